@@ -6,23 +6,48 @@ Uses bpy.app.timers for thread-safe execution of Blender API calls.
 """
 
 import bpy
+import inspect
 import threading
-import queue
-from typing import Callable, Dict, Any, Optional
-from functools import wraps
+import collections
+from typing import Callable, Dict, Any, Optional, FrozenSet
 
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from common.exceptions import MethodNotFoundError, CommandError
+from common.exceptions import MethodNotFoundError, CommandError, ValidationError
 
 
-# Queue for thread-safe command execution
-_command_queue = queue.Queue()
-_result_queue = queue.Queue()
+# Pending main-thread calls. deque.append/popleft are atomic, so producers
+# and the draining timer don't need a lock.
+_command_queue = collections.deque()
 _timer_registered = False
 
+# Timer intervals (seconds) while work is queued and while idle
+_BUSY_INTERVAL = 0.0
+_IDLE_INTERVAL = 0.01
+# Upper bound on calls run per timer tick so the UI stays responsive
+_MAX_CALLS_PER_TICK = 64
+
+# Method name -> handler function, shared with the global dispatcher
+HANDLERS: Dict[str, Callable] = {}
+
+
+def _accepted_params(func: Callable) -> Optional[FrozenSet[str]]:
+    """
+    Get the keyword names a handler accepts.
+    
+    Returns None if the handler takes **kwargs (anything is accepted).
+    """
+    names = []
+    for param in inspect.signature(func).parameters.values():
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            return None
+        if param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                          inspect.Parameter.KEYWORD_ONLY):
+            names.append(param.name)
+    return frozenset(names)
+
 
 class CommandDispatcher:
     """
@@ -30,20 +55,24 @@ class CommandDispatcher:
     Ensures thread-safe execution of Blender API calls.
     """
     
-    def __init__(self):
-        self._handlers: Dict[str, Callable] = {}
+    def __init__(self, handlers: Optional[Dict[str, Callable]] = None):
+        self._handlers: Dict[str, Callable] = {} if handlers is None else handlers
+        # Signatures are introspected once at registration, not per call
+        self._params: Dict[str, Optional[FrozenSet[str]]] = {}
         self._lock = threading.Lock()
     
     def register(self, method: str, handler: Callable):
         """Register a handler function for a method name."""
+        accepted = _accepted_params(handler)
         with self._lock:
             self._handlers[method] = handler
+            self._params[method] = accepted
     
     def unregister(self, method: str):
         """Unregister a handler for a method name."""
         with self._lock:
-            if method in self._handlers:
-                del self._handlers[method]
+            self._handlers.pop(method, None)
+            self._params.pop(method, None)
     
     def dispatch(self, method: str, params: Dict[str, Any]) -> Any:
         """
@@ -58,16 +87,43 @@ class CommandDispatcher:
             
         Raises:
             MethodNotFoundError: If no handler is registered for the method
+            ValidationError: If params contains names the handler doesn't accept
         """
-        with self._lock:
-            handler = self._handlers.get(method)
-        
-        if handler is None:
-            raise MethodNotFoundError(method)
+        handler = self.resolve(method, params)
         
         # Execute handler with thread-safe wrapper if needed
         return self._execute_threadsafe(handler, params)
     
+    def resolve(self, method: str, params: Dict[str, Any]) -> Callable:
+        """
+        Look up the handler for a method and validate its parameters.
+        
+        Args:
+            method: The method name to call
+            params: Parameters that will be passed to the handler
+            
+        Returns:
+            The handler function
+            
+        Raises:
+            MethodNotFoundError: If no handler is registered for the method
+            ValidationError: If params contains names the handler doesn't accept
+        """
+        # Plain dict reads are atomic under the GIL; the lock only guards writes
+        try:
+            handler = self._handlers[method]
+        except KeyError:
+            raise MethodNotFoundError(method) from None
+        
+        accepted = self._params.get(method)
+        if accepted is not None and not accepted.issuperset(params):
+            unknown = sorted(set(params) - accepted)
+            raise ValidationError(
+                f"Unknown parameter(s) for {method}: {', '.join(unknown)}",
+                details={"method": method, "unknown_params": unknown}
+            )
+        return handler
+    
     def _execute_threadsafe(self, handler: Callable, params: Dict[str, Any]) -> Any:
         """
         Execute a handler in a thread-safe manner.
@@ -92,7 +148,7 @@ class CommandDispatcher:
         result_event = threading.Event()
         result_container = {'result': None, 'error': None}
         
-        _command_queue.put((handler, params, result_event, result_container))
+        _command_queue.append((handler, params, result_event, result_container))
         
         # Ensure timer is registered
         _ensure_timer_registered()
@@ -113,21 +169,21 @@ class CommandDispatcher:
 
 def _process_command_queue():
     """Timer callback to process queued commands on the main thread."""
-    try:
-        while not _command_queue.empty():
-            handler, params, result_event, result_container = _command_queue.get_nowait()
-            
-            try:
-                result_container['result'] = handler(**params)
-            except Exception as e:
-                result_container['error'] = e
-            finally:
-                result_event.set()
-    except:
-        pass
+    for _ in range(_MAX_CALLS_PER_TICK):
+        try:
+            handler, params, result_event, result_container = _command_queue.popleft()
+        except IndexError:
+            break
+        
+        try:
+            result_container['result'] = handler(**params)
+        except Exception as e:
+            result_container['error'] = e
+        finally:
+            result_event.set()
     
-    # Return interval to keep timer running (0.01 seconds)
-    return 0.01
+    # Come straight back while work is pending, otherwise poll lazily
+    return _BUSY_INTERVAL if _command_queue else _IDLE_INTERVAL
 
 
 def _ensure_timer_registered():
@@ -136,7 +192,10 @@ def _ensure_timer_registered():
     if not _timer_registered:
         if bpy.app.timers.is_registered(_process_command_queue):
             bpy.app.timers.unregister(_process_command_queue)
-        bpy.app.timers.register(_process_command_queue, first_interval=0.01)
+        # Persistent so the timer survives loading a .blend file
+        bpy.app.timers.register(
+            _process_command_queue, first_interval=_IDLE_INTERVAL, persistent=True
+        )
         _timer_registered = True
 
 
@@ -148,7 +207,7 @@ def get_dispatcher() -> CommandDispatcher:
     """Get or create the global dispatcher instance."""
     global _dispatcher
     if _dispatcher is None:
-        _dispatcher = CommandDispatcher()
+        _dispatcher = CommandDispatcher(HANDLERS)
     return _dispatcher
 
 
@@ -162,12 +221,9 @@ def handler(method: str):
             ...
     """
     def decorator(func: Callable):
-        @wraps(func)
-        def wrapper(**kwargs):
-            return func(**kwargs)
-        
-        get_dispatcher().register(method, wrapper)
-        return wrapper
+        # Register the function itself so dispatch doesn't pay for a wrapper frame
+        get_dispatcher().register(method, func)
+        return func
     return decorator
 
 
@@ -195,6 +251,48 @@ def list_methods() -> dict:
     return {"methods": get_dispatcher().list_methods()}
 
 
+@handler("batch")
+def batch(calls: list) -> dict:
+    """
+    Execute several commands in a single main-thread invocation.
+    
+    Every call is resolved and validated before any of them runs, and the
+    batch stops at the first failing call.
+    
+    Args:
+        calls: List of {"method": str, "params": dict} entries
+        
+    Returns:
+        Dictionary with the per-call results in order
+    """
+    if not isinstance(calls, list):
+        raise ValidationError("calls must be a list")
+    
+    dispatcher = get_dispatcher()
+    resolved = []
+    for index, call in enumerate(calls):
+        if not isinstance(call, dict) or "method" not in call:
+            raise ValidationError(
+                f"Invalid batch call at index {index}",
+                details={"index": index}
+            )
+        params = call.get("params") or {}
+        resolved.append((dispatcher.resolve(call["method"], params), params))
+    
+    # Already on the main thread here, so handlers are called directly
+    results = []
+    for index, (func, params) in enumerate(resolved):
+        try:
+            results.append(func(**params))
+        except Exception as e:
+            raise CommandError(
+                f"Batch call {index} ({calls[index]['method']}) failed: {e}",
+                details={"index": index, "completed": index}
+            ) from e
+    
+    return {"results": results, "count": len(results)}
+
+
 def register_all_handlers():
     """
     Register all command handlers with the server.
@@ -7,7 +7,10 @@ Handlers for creating and managing materials in Blender.
 import bpy
 from typing import Optional, List
 
+from common.exceptions import CommandError, MaterialNotFoundError
+
 from .handlers import handler
+from .util import require_object
 
 
 @handler("create_material")
@@ -60,18 +63,13 @@ def apply_material(object_name: str, material_name: str) -> dict:
     Returns:
         dict confirming application
     """
-    obj = bpy.data.objects.get(object_name)
-    if obj is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(object_name)
+    obj = require_object(object_name)
     
     mat = bpy.data.materials.get(material_name)
     if mat is None:
-        from common.exceptions import MaterialNotFoundError
         raise MaterialNotFoundError(material_name)
     
     if obj.data is None:
-        from common.exceptions import CommandError
         raise CommandError(f"Object '{object_name}' has no data to apply material to")
     
     # Clear existing materials and add new one
@@ -99,7 +97,6 @@ def set_material_color(material_name: str, color: List[float]) -> dict:
     """
     mat = bpy.data.materials.get(material_name)
     if mat is None:
-        from common.exceptions import MaterialNotFoundError
         raise MaterialNotFoundError(material_name)
     
     if not mat.use_nodes:
@@ -131,7 +128,6 @@ def set_material_metallic(material_name: str, value: float) -> dict:
     """
     mat = bpy.data.materials.get(material_name)
     if mat is None:
-        from common.exceptions import MaterialNotFoundError
         raise MaterialNotFoundError(material_name)
     
     if not mat.use_nodes:
@@ -162,7 +158,6 @@ def set_material_roughness(material_name: str, value: float) -> dict:
     """
     mat = bpy.data.materials.get(material_name)
     if mat is None:
-        from common.exceptions import MaterialNotFoundError
         raise MaterialNotFoundError(material_name)
     
     if not mat.use_nodes:
@@ -219,7 +214,6 @@ def delete_material(name: str) -> dict:
     """
     mat = bpy.data.materials.get(name)
     if mat is None:
-        from common.exceptions import MaterialNotFoundError
         raise MaterialNotFoundError(name)
     
     bpy.data.materials.remove(mat)
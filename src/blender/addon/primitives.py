@@ -5,9 +5,86 @@ Handlers for creating 3D primitive shapes in Blender.
 """
 
 import bpy
-from typing import Optional, List, Tuple
+import bmesh
+import math
+from mathutils import Matrix
+from typing import Optional, List, Tuple, Dict, Callable
 
 from .handlers import handler
+from .util import require_object, forget_object
+
+
+# Cached mesh datablocks (shared instance meshes and copy templates), keyed
+# by (kind, *params). Stores mesh names rather than references so a mesh
+# removed by the user (or by clear_scene/load_scene) is simply rebuilt.
+_MESH_CACHE: Dict[tuple, str] = {}
+
+
+# (collection pointer, bound objects.link) for the active collection
+_link_cache: Tuple[int, Optional[Callable]] = (0, None)
+
+
+def _get_link() -> Callable:
+    """
+    Get the active collection's objects.link method.
+    
+    The bound method is cached and only re-resolved when the active
+    collection changes (e.g. after a scene switch).
+    """
+    global _link_cache
+    collection = bpy.context.collection
+    pointer = collection.as_pointer()
+    if _link_cache[0] != pointer:
+        _link_cache = (pointer, collection.objects.link)
+    return _link_cache[1]
+
+
+def _get_cached_mesh(key: tuple, mesh_name: str, build: Callable, template: bool = False):
+    """
+    Get (or build) a cached mesh datablock.
+    
+    Args:
+        key: Cache key identifying the geometry
+        mesh_name: Name for the mesh when it has to be built
+        build: Callable filling a fresh bmesh with the geometry
+        template: The mesh is only ever copied, never used by an object, so
+                  give it a fake user to keep it from being an orphan that
+                  is dropped on save/reload
+    """
+    cached_name = _MESH_CACHE.get(key)
+    mesh = bpy.data.meshes.get(cached_name) if cached_name else None
+    
+    if mesh is None:
+        mesh = bpy.data.meshes.new(mesh_name)
+        bm = bmesh.new()
+        build(bm)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.use_fake_user = template
+        _MESH_CACHE[key] = mesh.name
+    
+    return mesh
+
+
+def _get_cube_mesh(size: float):
+    """Get (or build) the shared cube mesh for the given size."""
+    return _get_cached_mesh(
+        ("cube", size),
+        f"CubeInstance_{size:g}",
+        lambda bm: bmesh.ops.create_cube(bm, size=size),
+    )
+
+
+def _get_uvsphere_template(segments: int, ring_count: int):
+    """Get (or build) a unit-radius UV sphere mesh used as a copy template."""
+    return _get_cached_mesh(
+        ("uvsphere", segments, ring_count),
+        f"SphereTemplate_{segments}x{ring_count}",
+        lambda bm: bmesh.ops.create_uvsphere(
+            bm, u_segments=segments, v_segments=ring_count, radius=1.0
+        ),
+        template=True,
+    )
 
 
 @handler("create_cube")
@@ -27,30 +104,64 @@ def create_cube(
     Returns:
         dict with object_id and object info
     """
-    loc = tuple(location) if location else (0, 0, 0)
-    
     # Create cube mesh data directly (works in headless mode)
     mesh = bpy.data.meshes.new(name or "Cube")
     obj = bpy.data.objects.new(name or "Cube", mesh)
     
     # Link to scene
-    bpy.context.collection.objects.link(obj)
+    _get_link()(obj)
     
     # Create cube geometry using bmesh
-    import bmesh
     bm = bmesh.new()
     bmesh.ops.create_cube(bm, size=size)
     bm.to_mesh(mesh)
     bm.free()
     
-    # Set location
-    obj.location = loc
+    # Set location (new objects start at the origin)
+    if location:
+        obj.location = tuple(location)
     
     return {
         "object_id": obj.name,
         "type": "MESH",
-        "location": list(obj.location),
-        "dimensions": list(obj.dimensions),
+        "location": obj.location[:],
+        "dimensions": obj.dimensions[:],
+    }
+
+
+@handler("create_cube_instances")
+def create_cube_instances(
+    locations: List[List[float]],
+    size: float = 2.0,
+    name: Optional[str] = None
+) -> dict:
+    """
+    Create many cubes sharing a single mesh datablock (linked duplicates).
+    
+    Args:
+        locations: List of XYZ coordinates, one per cube
+        size: Size of the cubes, defaults to 2.0
+        name: Optional base name for the objects
+        
+    Returns:
+        dict with the created object ids and the shared mesh name
+    """
+    mesh = _get_cube_mesh(size)
+    new_object = bpy.data.objects.new
+    link = _get_link()
+    base_name = name or "Cube"
+    
+    object_ids = []
+    for loc in locations:
+        obj = new_object(base_name, mesh)
+        obj.location = loc
+        link(obj)
+        object_ids.append(obj.name)
+    
+    return {
+        "object_ids": object_ids,
+        "mesh": mesh.name,
+        "count": len(object_ids),
     }
 
 
@@ -75,26 +186,26 @@ def create_sphere(
     Returns:
         dict with object_id and object info
     """
-    loc = tuple(location) if location else (0, 0, 0)
+    # Copy a cached unit sphere instead of regenerating the rings, so the
+    # trig for common segment/ring counts is only computed once
+    mesh = _get_uvsphere_template(segments, ring_count).copy()
+    # The copy is owned by its object; don't inherit the template's fake user
+    mesh.use_fake_user = False
+    mesh.name = name or "Sphere"
+    if radius != 1.0:
+        mesh.transform(Matrix.Scale(radius, 4))
     
-    # Create sphere mesh data directly (works in headless mode)
-    import bmesh
-    mesh = bpy.data.meshes.new(name or "Sphere")
     obj = bpy.data.objects.new(name or "Sphere", mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    bm = bmesh.new()
-    bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=ring_count, radius=radius)
-    bm.to_mesh(mesh)
-    bm.free()
+    _get_link()(obj)
     
-    obj.location = loc
+    if location:
+        obj.location = tuple(location)
     
     return {
         "object_id": obj.name,
         "type": "MESH",
-        "location": list(obj.location),
-        "dimensions": list(obj.dimensions),
+        "location": obj.location[:],
+        "dimensions": obj.dimensions[:],
     }
 
 
@@ -119,12 +230,9 @@ def create_cylinder(
     Returns:
         dict with object_id and object info
     """
-    loc = tuple(location) if location else (0, 0, 0)
-    
-    import bmesh
     mesh = bpy.data.meshes.new(name or "Cylinder")
     obj = bpy.data.objects.new(name or "Cylinder", mesh)
-    bpy.context.collection.objects.link(obj)
+    _get_link()(obj)
     
     bm = bmesh.new()
     bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=vertices,
@@ -132,13 +240,14 @@ def create_cylinder(
     bm.to_mesh(mesh)
     bm.free()
     
-    obj.location = loc
+    if location:
+        obj.location = tuple(location)
     
     return {
         "object_id": obj.name,
         "type": "MESH",
-        "location": list(obj.location),
-        "dimensions": list(obj.dimensions),
+        "location": obj.location[:],
+        "dimensions": obj.dimensions[:],
     }
 
 
@@ -165,12 +274,9 @@ def create_cone(
     Returns:
         dict with object_id and object info
     """
-    loc = tuple(location) if location else (0, 0, 0)
-    
-    import bmesh
     mesh = bpy.data.meshes.new(name or "Cone")
     obj = bpy.data.objects.new(name or "Cone", mesh)
-    bpy.context.collection.objects.link(obj)
+    _get_link()(obj)
     
     bm = bmesh.new()
     bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=vertices,
@@ -178,13 +284,14 @@ def create_cone(
     bm.to_mesh(mesh)
     bm.free()
     
-    obj.location = loc
+    if location:
+        obj.location = tuple(location)
     
     return {
         "object_id": obj.name,
         "type": "MESH",
-        "location": list(obj.location),
-        "dimensions": list(obj.dimensions),
+        "location": obj.location[:],
+        "dimensions": obj.dimensions[:],
     }
 
 
@@ -211,13 +318,9 @@ def create_torus(
     Returns:
         dict with object_id and object info
     """
-    loc = tuple(location) if location else (0, 0, 0)
-    
-    import bmesh
-    import math
     mesh = bpy.data.meshes.new(name or "Torus")
     obj = bpy.data.objects.new(name or "Torus", mesh)
-    bpy.context.collection.objects.link(obj)
+    _get_link()(obj)
     
     bm = bmesh.new()
     bmesh.ops.create_circle(bm, cap_ends=False, radius=minor_radius, segments=minor_segments)
@@ -226,13 +329,14 @@ def create_torus(
     bm.to_mesh(mesh)
     bm.free()
     
-    obj.location = loc
+    if location:
+        obj.location = tuple(location)
     
     return {
         "object_id": obj.name,
         "type": "MESH",
-        "location": list(obj.location),
-        "dimensions": list(obj.dimensions),
+        "location": obj.location[:],
+        "dimensions": obj.dimensions[:],
     }
 
 
@@ -253,12 +357,9 @@ def create_plane(
     Returns:
         dict with object_id and object info
     """
-    loc = tuple(location) if location else (0, 0, 0)
-    
-    import bmesh
     mesh = bpy.data.meshes.new(name or "Plane")
     obj = bpy.data.objects.new(name or "Plane", mesh)
-    bpy.context.collection.objects.link(obj)
+    _get_link()(obj)
     
     bm = bmesh.new()
     half = size / 2
@@ -270,13 +371,14 @@ def create_plane(
     bm.to_mesh(mesh)
     bm.free()
     
-    obj.location = loc
+    if location:
+        obj.location = tuple(location)
     
     return {
         "object_id": obj.name,
         "type": "MESH",
-        "location": list(obj.location),
-        "dimensions": list(obj.dimensions),
+        "location": obj.location[:],
+        "dimensions": obj.dimensions[:],
     }
 
 
@@ -298,17 +400,16 @@ def create_empty(
     Returns:
         dict with object_id and object info
     """
-    loc = tuple(location) if location else (0, 0, 0)
-    
     obj = bpy.data.objects.new(name or "Empty", None)
     obj.empty_display_type = empty_type
-    obj.location = loc
-    bpy.context.collection.objects.link(obj)
+    if location:
+        obj.location = tuple(location)
+    _get_link()(obj)
     
     return {
         "object_id": obj.name,
         "type": "EMPTY",
-        "location": list(obj.location),
+        "location": obj.location[:],
         "empty_display_type": obj.empty_display_type,
     }
 
@@ -324,23 +425,20 @@ def get_object(name: str) -> dict:
     Returns:
         dict with object information
     """
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(name)
+    obj = require_object(name)
     
     result = {
         "object_id": obj.name,
         "type": obj.type,
-        "location": list(obj.location),
-        "rotation": list(obj.rotation_euler),
-        "scale": list(obj.scale),
+        "location": obj.location[:],
+        "rotation": obj.rotation_euler[:],
+        "scale": obj.scale[:],
     }
     
     if obj.type == 'MESH':
         result["vertices"] = len(obj.data.vertices)
         result["faces"] = len(obj.data.polygons)
-        result["dimensions"] = list(obj.dimensions)
+        result["dimensions"] = obj.dimensions[:]
     
     return result
 
@@ -357,13 +455,24 @@ def list_objects(object_type: Optional[str] = None) -> dict:
         dict with list of objects
     """
     objects = []
-    for obj in bpy.data.objects:
-        if object_type is None or obj.type == object_type:
-            objects.append({
+    append = objects.append
+    
+    # Split the loops so each object's type is read from RNA at most once
+    if object_type is None:
+        for obj in bpy.data.objects:
+            append({
                 "name": obj.name,
                 "type": obj.type,
-                "location": list(obj.location),
+                "location": obj.location[:],
             })
+    else:
+        for obj in bpy.data.objects:
+            if obj.type == object_type:
+                append({
+                    "name": obj.name,
+                    "type": object_type,
+                    "location": obj.location[:],
+                })
     
     return {"objects": objects, "count": len(objects)}
 
@@ -379,11 +488,9 @@ def delete_object(name: str) -> dict:
     Returns:
         dict confirming deletion
     """
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(name)
+    obj = require_object(name)
     
+    forget_object(name)
     bpy.data.objects.remove(obj, do_unlink=True)
     
     return {"deleted": name, "success": True}
@@ -401,13 +508,12 @@ def select_object(name: str, add_to_selection: bool = False) -> dict:
     Returns:
         dict confirming selection
     """
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(name)
+    obj = require_object(name)
     
     if not add_to_selection:
-        bpy.ops.object.select_all(action='DESELECT')
+        # Clear only what is selected, without the operator's poll/undo overhead
+        for selected in bpy.context.selected_objects:
+            selected.select_set(False)
     
     obj.select_set(True)
     bpy.context.view_layer.objects.active = obj
@@ -434,10 +540,7 @@ def transform_object(
     Returns:
         dict with updated transform
     """
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(name)
+    obj = require_object(name)
     
     if location is not None:
         obj.location = tuple(location)
@@ -448,43 +551,47 @@ def transform_object(
     
     return {
         "object_id": obj.name,
-        "location": list(obj.location),
-        "rotation": list(obj.rotation_euler),
-        "scale": list(obj.scale),
+        "location": obj.location[:],
+        "rotation": obj.rotation_euler[:],
+        "scale": obj.scale[:],
     }
 
 
 @handler("duplicate_object")
-def duplicate_object(name: str, new_name: Optional[str] = None) -> dict:
+def duplicate_object(
+    name: str,
+    new_name: Optional[str] = None,
+    link_data: bool = False
+) -> dict:
     """
     Duplicate an object.
     
     Args:
         name: Name of the object to duplicate
         new_name: Optional name for the new object
+        link_data: If True, share the source's data block (linked duplicate)
+                   instead of copying it
         
     Returns:
         dict with new object info
     """
-    obj = bpy.data.objects.get(name)
-    if obj is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(name)
+    obj = require_object(name)
     
     new_obj = obj.copy()
-    if obj.data:
+    if obj.data and not link_data:
         new_obj.data = obj.data.copy()
     
     if new_name:
         new_obj.name = new_name
     
-    bpy.context.collection.objects.link(new_obj)
+    _get_link()(new_obj)
     
     return {
         "object_id": new_obj.name,
         "source": name,
         "type": new_obj.type,
-        "location": list(new_obj.location),
+        "location": new_obj.location[:],
+        "linked_data": link_data,
     }
 
 
@@ -500,11 +607,9 @@ def rename_object(old_name: str, new_name: str) -> dict:
     Returns:
         dict confirming rename
     """
-    obj = bpy.data.objects.get(old_name)
-    if obj is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(old_name)
+    obj = require_object(old_name)
     
+    forget_object(old_name)
     obj.name = new_name
     
     return {
@@ -6,9 +6,19 @@ Handlers for rendering and export operations in Blender.
 
 import bpy
 import os
+import io
+import sys
 from typing import Optional, List
 
+from common.exceptions import ValidationError
+
 from .handlers import handler
+from .util import find_object
+
+
+_VALID_ENGINES = frozenset({
+    'CYCLES', 'BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT', 'BLENDER_WORKBENCH'
+})
 
 
 @handler("set_render_engine")
@@ -22,11 +32,8 @@ def set_render_engine(engine: str = "CYCLES") -> dict:
     Returns:
         dict with engine info
     """
-    valid_engines = ['CYCLES', 'BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT', 'BLENDER_WORKBENCH']
-    
-    if engine not in valid_engines:
-        from common.exceptions import ValidationError
-        raise ValidationError(f"Invalid engine. Must be one of: {valid_engines}")
+    if engine not in _VALID_ENGINES:
+        raise ValidationError(f"Invalid engine. Must be one of: {sorted(_VALID_ENGINES)}")
     
     bpy.context.scene.render.engine = engine
     
@@ -212,7 +219,7 @@ def export_obj(filepath: str, objects: Optional[List[str]] = None) -> dict:
     if objects:
         bpy.ops.object.select_all(action='DESELECT')
         for name in objects:
-            obj = bpy.data.objects.get(name)
+            obj = find_object(name)
             if obj:
                 obj.select_set(True)
         export_selected = True
@@ -253,7 +260,7 @@ def export_fbx(filepath: str, objects: Optional[List[str]] = None) -> dict:
     if objects:
         bpy.ops.object.select_all(action='DESELECT')
         for name in objects:
-            obj = bpy.data.objects.get(name)
+            obj = find_object(name)
             if obj:
                 obj.select_set(True)
         use_selection = True
@@ -299,7 +306,7 @@ def export_gltf(
     if objects:
         bpy.ops.object.select_all(action='DESELECT')
         for name in objects:
-            obj = bpy.data.objects.get(name)
+            obj = find_object(name)
             if obj:
                 obj.select_set(True)
         use_selection = True
@@ -341,7 +348,7 @@ def export_stl(filepath: str, objects: Optional[List[str]] = None) -> dict:
     if objects:
         bpy.ops.object.select_all(action='DESELECT')
         for name in objects:
-            obj = bpy.data.objects.get(name)
+            obj = find_object(name)
             if obj:
                 obj.select_set(True)
         export_selected = True
@@ -372,9 +379,6 @@ def execute_python(code: str) -> dict:
     Returns:
         dict with execution result
     """
-    import io
-    import sys
-    
     # Capture stdout/stderr
     old_stdout = sys.stdout
     old_stderr = sys.stderr
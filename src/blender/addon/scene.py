@@ -7,55 +7,161 @@ Handlers for scene management, cameras, and lights in Blender.
 import bpy
 from typing import Optional, List
 import math
+import sys
+import base64
+from array import array
+from collections import Counter
+
+from common.exceptions import CommandError, ValidationError
 
 from .handlers import handler
+from .util import require_object
+
+
+# Per-object record layout for binary scene info (float32 each)
+_BINARY_LAYOUT = (
+    "loc_x", "loc_y", "loc_z",
+    "rot_x", "rot_y", "rot_z",
+    "scale_x", "scale_y", "scale_z",
+    "type_id",
+)
+
+# Object type -> numeric id used in the binary type_id column
+_OBJECT_TYPE_IDS = {
+    obj_type: i for i, obj_type in enumerate((
+        'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'CURVES', 'POINTCLOUD',
+        'VOLUME', 'GPENCIL', 'GREASEPENCIL', 'ARMATURE', 'LATTICE', 'EMPTY',
+        'LIGHT', 'LIGHT_PROBE', 'CAMERA', 'SPEAKER',
+    ))
+}
+
+
+def _scene_header(scene) -> dict:
+    """Build the scene fields shared by every get_scene_info response."""
+    camera = scene.camera
+    return {
+        "scene_name": scene.name,
+        "frame_current": scene.frame_current,
+        "frame_start": scene.frame_start,
+        "frame_end": scene.frame_end,
+        "active_camera": camera.name if camera else None,
+    }
+
+
+def _scene_info_binary(scene) -> dict:
+    """
+    Pack per-object transforms into a float32 buffer.
+    
+    Each object is one record of len(_BINARY_LAYOUT) little-endian float32
+    values; names are returned in the header in the same order.
+    """
+    type_ids = _OBJECT_TYPE_IDS
+    names = []
+    data = array('f')
+    
+    for obj in scene.objects:
+        names.append(obj.name)
+        data.extend(obj.location)
+        data.extend(obj.rotation_euler)
+        data.extend(obj.scale)
+        data.append(type_ids.get(obj.type, -1))
+    
+    if sys.byteorder != "little":
+        data.byteswap()
+    
+    info = _scene_header(scene)
+    info.update({
+        "format": "binary",
+        "header": {
+            "count": len(names),
+            "dtype": "float32",
+            "byte_order": "little",
+            "stride": len(_BINARY_LAYOUT),
+            "layout": list(_BINARY_LAYOUT),
+            "type_ids": _OBJECT_TYPE_IDS,
+            "names": names,
+        },
+        "payload_b64": base64.b64encode(data.tobytes()).decode("ascii"),
+    })
+    return info
 
 
 @handler("get_scene_info")
-def get_scene_info() -> dict:
+def get_scene_info(fields: Optional[List[str]] = None, format: str = "json") -> dict:
     """
     Get full scene information.
     
+    Args:
+        fields: Optional per-object fields to include besides name and type
+                (location, rotation, scale, light). Pass ["counts"] to only
+                get object/camera/light counts. All fields if None.
+        format: "json" for per-object dicts, or "binary" for a compact
+                base64-encoded float32 transform buffer (see header.layout)
+    
     Returns:
         dict with scene state including objects, materials, cameras, lights
     """
     scene = bpy.context.scene
     
+    if format == "binary":
+        return _scene_info_binary(scene)
+    if format != "json":
+        raise ValidationError(f"Invalid format: {format}. Must be 'json' or 'binary'")
+    
+    info = _scene_header(scene)
+    
+    if fields is not None and "counts" in fields:
+        # Single pass over types only; no per-object dicts
+        counts = Counter(obj.type for obj in scene.objects)
+        camera_count = counts.pop('CAMERA', 0)
+        light_count = counts.pop('LIGHT', 0)
+        info["object_count"] = sum(counts.values())
+        info["camera_count"] = camera_count
+        info["light_count"] = light_count
+        return info
+    
+    need_location = fields is None or "location" in fields
+    need_rotation = fields is None or "rotation" in fields
+    need_scale = fields is None or "scale" in fields
+    need_light = fields is None or "light" in fields
+    
     objects = []
     cameras = []
     lights = []
     
-    for obj in bpy.data.objects:
+    for obj in scene.objects:
+        obj_type = obj.type
         obj_info = {
             "name": obj.name,
-            "type": obj.type,
-            "location": list(obj.location),
-            "rotation": list(obj.rotation_euler),
-            "scale": list(obj.scale),
+            "type": obj_type,
         }
+        if need_location:
+            obj_info["location"] = obj.location[:]
+        if need_rotation:
+            obj_info["rotation"] = obj.rotation_euler[:]
+        if need_scale:
+            obj_info["scale"] = obj.scale[:]
         
-        if obj.type == 'CAMERA':
+        if obj_type == 'CAMERA':
             cameras.append(obj_info)
-        elif obj.type == 'LIGHT':
-            obj_info["light_type"] = obj.data.type
-            obj_info["energy"] = obj.data.energy
+        elif obj_type == 'LIGHT':
+            if need_light:
+                light = obj.data
+                obj_info["light_type"] = light.type
+                obj_info["energy"] = light.energy
             lights.append(obj_info)
         else:
             objects.append(obj_info)
     
-    return {
-        "scene_name": scene.name,
-        "frame_current": scene.frame_current,
-        "frame_start": scene.frame_start,
-        "frame_end": scene.frame_end,
+    info.update({
         "objects": objects,
         "cameras": cameras,
         "lights": lights,
-        "active_camera": scene.camera.name if scene.camera else None,
         "object_count": len(objects),
         "camera_count": len(cameras),
         "light_count": len(lights),
-    }
+    })
+    return info
 
 
 @handler("clear_scene")
@@ -70,16 +176,21 @@ def clear_scene(keep_cameras: bool = False, keep_lights: bool = False) -> dict:
     Returns:
         dict with deletion summary
     """
-    deleted = []
-    
-    for obj in list(bpy.data.objects):
-        if keep_cameras and obj.type == 'CAMERA':
-            continue
-        if keep_lights and obj.type == 'LIGHT':
-            continue
-        
-        deleted.append(obj.name)
-        bpy.data.objects.remove(obj, do_unlink=True)
+    keep = set()
+    if keep_cameras:
+        keep.add('CAMERA')
+    if keep_lights:
+        keep.add('LIGHT')
+    
+    to_delete = [obj for obj in bpy.context.scene.objects if obj.type not in keep]
+    deleted = [obj.name for obj in to_delete]
+    
+    if hasattr(bpy.data, "batch_remove"):
+        # One C-level call instead of a Python round-trip per object
+        bpy.data.batch_remove(ids=to_delete)
+    else:
+        for obj in to_delete:
+            bpy.data.objects.remove(obj, do_unlink=True)
     
     return {
         "deleted": deleted,
@@ -180,8 +291,8 @@ def add_camera(
     return {
         "object_id": camera.name,
         "type": "CAMERA",
-        "location": list(camera.location),
-        "rotation": list(camera.rotation_euler),
+        "location": camera.location[:],
+        "rotation": camera.rotation_euler[:],
         "lens": camera.data.lens,
     }
 
@@ -224,9 +335,9 @@ def add_light(
         "object_id": light.name,
         "type": "LIGHT",
         "light_type": light_type,
-        "location": list(light.location),
+        "location": light.location[:],
         "energy": light.data.energy,
-        "color": list(light.data.color),
+        "color": light.data.color[:],
     }
 
 
@@ -241,13 +352,9 @@ def set_active_camera(name: str) -> dict:
     Returns:
         dict confirming camera set
     """
-    camera = bpy.data.objects.get(name)
-    if camera is None:
-        from common.exceptions import ObjectNotFoundError
-        raise ObjectNotFoundError(name)
+    camera = require_object(name)
     
     if camera.type != 'CAMERA':
-        from common.exceptions import CommandError
         raise CommandError(f"Object '{name}' is not a camera")
     
     bpy.context.scene.camera = camera
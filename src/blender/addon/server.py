@@ -2,11 +2,12 @@
 Blender Socket Server
 =====================
 TCP socket server that runs inside Blender and accepts JSON-RPC commands.
-Uses threading for non-blocking operation and bpy.app.timers for thread-safe
-Blender API calls.
+A single selector-driven IO thread serves every client, and bpy.app.timers
+are used for thread-safe Blender API calls.
 """
 
 import socket
+import selectors
 import threading
 import json
 import sys
@@ -15,9 +16,13 @@ import os
 # Add common module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from common.protocol import Request, Response, ErrorResponse
+from common.protocol import (
+    Request, ErrorResponse, FRAME_MAGIC, encode_success, loads, pack_frame, unpack_frames
+)
 from common.exceptions import TDMAPIError, MethodNotFoundError
 
+from . import util
+
 # Global server instance
 _server_instance = None
 _server_lock = threading.Lock()
@@ -25,8 +30,43 @@ _server_lock = threading.Lock()
 # Default configuration
 DEFAULT_HOST = 'localhost'
 DEFAULT_PORT = 9876
-BUFFER_SIZE = 4096
+BUFFER_SIZE = 65536
 CONNECTION_TIMEOUT = 60.0
+# How often the IO loop wakes up to check for shutdown
+SELECT_TIMEOUT = 1.0
+# Kernel send buffer for client sockets, sized for bulk scene info replies
+SEND_BUFFER_SIZE = 1 << 20
+
+
+def _tune_client_socket(client_socket: socket.socket):
+    """Configure an accepted client socket for low-latency RPC."""
+    # Don't let small responses sit in Nagle's buffer
+    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_SIZE)
+    # Let the kernel detect dead peers as well
+    client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, 'TCP_USER_TIMEOUT'):
+        client_socket.setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, int(CONNECTION_TIMEOUT * 1000)
+        )
+
+
+class _ClientConnection:
+    """Per-connection state owned by the server's IO thread."""
+    
+    __slots__ = ("sock", "address", "buffer", "scan_from", "framed", "outbox", "closed")
+    
+    def __init__(self, sock: socket.socket, address: tuple):
+        self.sock = sock
+        self.address = address
+        self.buffer = bytearray()
+        # Bytes already scanned for a delimiter; a message split across many
+        # recv() calls is then scanned once overall instead of once per chunk
+        self.scan_from = 0
+        self.framed = None  # Undecided until the first bytes arrive
+        # Response bytes the socket couldn't take yet
+        self.outbox = bytearray()
+        self.closed = False
 
 
 class BlenderSocketServer:
@@ -43,9 +83,14 @@ class BlenderSocketServer:
         self.socket = None
         self.running = False
         self.thread = None
+        self._selector = None
         self.clients = []
         self.clients_lock = threading.Lock()
         
+        # Receive buffer shared by all connections; only the IO thread reads
+        self._recv_buf = bytearray(BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buf)
+        
         # Command dispatcher (set by handlers module)
         self.dispatcher = None
     
@@ -56,18 +101,28 @@ class BlenderSocketServer:
         
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.socket.settimeout(1.0)  # Allow periodic checks for shutdown
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         
         try:
             self.socket.bind((self.host, self.port))
             self.socket.listen(5)
+            self.socket.setblocking(False)
+            
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.socket, selectors.EVENT_READ, None)
             self.running = True
             
-            self.thread = threading.Thread(target=self._accept_loop, daemon=True)
+            # Keep the handlers' object lookup cache coherent with the scene
+            util.register_cache_handlers()
+            
+            self.thread = threading.Thread(target=self._serve_loop, daemon=True)
             self.thread.start()
             
             print(f"3DM-API Server started on {self.host}:{self.port}")
         except Exception as e:
+            if self._selector:
+                self._selector.close()
+                self._selector = None
             self.socket.close()
             raise e
     
@@ -75,16 +130,21 @@ class BlenderSocketServer:
         """Stop the socket server and close all connections."""
         self.running = False
         
-        # Close all client connections
+        # The IO thread notices within one select() timeout and closes
+        # every socket it owns on the way out
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=2.0)
+        self.thread = None
+        
+        # Close anything left over if the thread didn't exit in time
         with self.clients_lock:
-            for client in self.clients:
+            for conn in self.clients:
                 try:
-                    client.close()
+                    conn.sock.close()
                 except:
                     pass
             self.clients.clear()
         
-        # Close server socket
         if self.socket:
             try:
                 self.socket.close()
@@ -92,126 +152,213 @@ class BlenderSocketServer:
                 pass
             self.socket = None
         
-        # Wait for thread to finish
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=2.0)
+        util.unregister_cache_handlers()
         
         print("3DM-API Server stopped")
     
-    def _accept_loop(self):
-        """Main loop that accepts incoming connections."""
-        while self.running:
+    def _serve_loop(self):
+        """IO loop that accepts connections and serves every client."""
+        selector = self._selector
+        try:
+            while self.running:
+                for key, mask in selector.select(timeout=SELECT_TIMEOUT):
+                    conn = key.data
+                    if conn is None:
+                        self._accept()
+                        continue
+                    if mask & selectors.EVENT_READ:
+                        self._on_readable(conn)
+                    if mask & selectors.EVENT_WRITE and not conn.closed:
+                        self._flush(conn)
+        except Exception as e:
+            if self.running:
+                print(f"Server loop error: {e}")
+        finally:
+            with self.clients_lock:
+                clients = list(self.clients)
+            for conn in clients:
+                self._close(conn)
+            selector.close()
+            self._selector = None
+    
+    def _accept(self):
+        """Accept every pending connection on the listening socket."""
+        while True:
             try:
                 client_socket, address = self.socket.accept()
-                client_socket.settimeout(CONNECTION_TIMEOUT)
-                
-                with self.clients_lock:
-                    self.clients.append(client_socket)
-                
-                # Handle client in a new thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, address),
-                    daemon=True
-                )
-                client_thread.start()
-                
-            except socket.timeout:
-                # Normal timeout, check if still running
-                continue
+            except (BlockingIOError, InterruptedError):
+                return
             except Exception as e:
                 if self.running:
                     print(f"Accept error: {e}")
+                return
+            
+            client_socket.setblocking(False)
+            _tune_client_socket(client_socket)
+            conn = _ClientConnection(client_socket, address)
+            
+            with self.clients_lock:
+                self.clients.append(conn)
+            self._selector.register(client_socket, selectors.EVENT_READ, conn)
     
-    def _handle_client(self, client_socket: socket.socket, address: tuple):
-        """Handle a single client connection."""
-        buffer = ""
+    def _on_readable(self, conn: "_ClientConnection"):
+        """
+        Read from a client and answer every complete message.
         
+        Connections use newline-delimited JSON unless the client opens with
+        FRAME_MAGIC, in which case every message is length-prefixed.
+        """
         try:
-            while self.running:
-                try:
-                    data = client_socket.recv(BUFFER_SIZE)
-                    if not data:
-                        break
-                    
-                    buffer += data.decode('utf-8')
-                    
-                    # Process complete messages (newline-delimited)
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        if line.strip():
-                            response = self._process_message(line)
-                            client_socket.send(response.encode('utf-8'))
-                            
-                except socket.timeout:
-                    # Send ping to check if client is still alive
-                    continue
-                except Exception as e:
-                    error_response = ErrorResponse(
-                        code="RECEIVE_ERROR",
-                        message=str(e)
-                    )
-                    try:
-                        client_socket.send(error_response.to_json().encode('utf-8'))
-                    except:
-                        pass
-                    break
-        finally:
-            # Remove client from list and close
-            with self.clients_lock:
-                if client_socket in self.clients:
-                    self.clients.remove(client_socket)
-            try:
-                client_socket.close()
-            except:
-                pass
+            n = conn.sock.recv_into(self._recv_view)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(conn)
+            return
+        if not n:
+            self._close(conn)
+            return
+        
+        buffer = conn.buffer
+        buffer += self._recv_view[:n]
+        
+        try:
+            if conn.framed is None:
+                if len(buffer) < len(FRAME_MAGIC) and FRAME_MAGIC.startswith(buffer):
+                    return  # Too short to tell yet
+                conn.framed = buffer.startswith(FRAME_MAGIC)
+                if conn.framed:
+                    del buffer[:len(FRAME_MAGIC)]
+                    self._send(conn, FRAME_MAGIC)
+            
+            if conn.framed:
+                for body in unpack_frames(buffer):
+                    self._send(conn, pack_frame(self._process_message(body)))
+                return
+            
+            # Process complete messages (newline-delimited)
+            start = 0
+            idx = buffer.find(b'\n', conn.scan_from)
+            while idx >= 0:
+                line = bytes(buffer[start:idx])
+                start = idx + 1
+                if line and not line.isspace():
+                    self._send(conn, self._process_message(line) + b'\n')
+                idx = buffer.find(b'\n', start)
+            
+            # Drop all consumed messages with a single shift
+            if start:
+                del buffer[:start]
+            conn.scan_from = len(buffer)
+        except Exception as e:
+            error_response = ErrorResponse(
+                code="RECEIVE_ERROR",
+                message=str(e)
+            )
+            if conn.framed:
+                self._send(conn, pack_frame(error_response.encode()))
+            else:
+                self._send(conn, error_response.to_bytes())
+            self._flush(conn)
+            self._close(conn)
+    
+    def _send(self, conn: "_ClientConnection", data: bytes):
+        """Send data to a client, queueing whatever the socket won't take."""
+        if conn.closed:
+            return
+        if conn.outbox:
+            conn.outbox += data
+            return
+        
+        try:
+            sent = conn.sock.send(data)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._close(conn)
+            return
+        
+        if sent < len(data):
+            # Only watch for writability while there is a backlog
+            conn.outbox += memoryview(data)[sent:]
+            self._selector.modify(
+                conn.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, conn
+            )
     
-    def _process_message(self, message: str) -> str:
-        """Process a JSON-RPC message and return the response."""
+    def _flush(self, conn: "_ClientConnection"):
+        """Write as much queued output to a client as the socket accepts."""
+        if conn.closed or not conn.outbox:
+            return
         try:
-            request = Request.from_json(message)
+            sent = conn.sock.send(conn.outbox)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(conn)
+            return
+        
+        del conn.outbox[:sent]
+        if not conn.outbox:
+            self._selector.modify(conn.sock, selectors.EVENT_READ, conn)
+    
+    def _close(self, conn: "_ClientConnection"):
+        """Unregister and close a client connection."""
+        if conn.closed:
+            return
+        conn.closed = True
+        
+        with self.clients_lock:
+            if conn in self.clients:
+                self.clients.remove(conn)
+        try:
+            self._selector.unregister(conn.sock)
+        except Exception:
+            pass
+        try:
+            conn.sock.close()
+        except:
+            pass
+    
+    def _process_message(self, message: bytes) -> bytes:
+        """Process a JSON-RPC message and return the encoded response body."""
+        try:
+            request = Request.from_dict(loads(message))
             
             if self.dispatcher is None:
-                error = ErrorResponse(
+                return ErrorResponse(
                     code="SERVER_NOT_READY",
                     message="Command dispatcher not initialized",
                     id=request.id
-                )
-                return error.to_json()
+                ).encode()
             
             # Execute command through dispatcher
             try:
                 result = self.dispatcher.dispatch(request.method, request.params)
-                response = Response(result=result, id=request.id)
-                return response.to_json()
+                return encode_success(result, request.id)
             except TDMAPIError as e:
-                error = ErrorResponse(
+                return ErrorResponse(
                     code=e.code,
                     message=e.message,
                     details=e.details,
                     id=request.id
-                )
-                return error.to_json()
+                ).encode()
             except Exception as e:
-                error = ErrorResponse(
+                return ErrorResponse(
                     code="EXECUTION_ERROR",
                     message=str(e),
                     id=request.id
-                )
-                return error.to_json()
+                ).encode()
                 
         except json.JSONDecodeError as e:
-            error = ErrorResponse(
+            return ErrorResponse(
                 code="PARSE_ERROR",
                 message=f"Invalid JSON: {e}"
-            )
-            return error.to_json()
+            ).encode()
         except Exception as e:
-            error = ErrorResponse(
+            return ErrorResponse(
                 code="INTERNAL_ERROR",
                 message=str(e)
-            )
-            return error.to_json()
+            ).encode()
     
     def set_dispatcher(self, dispatcher):
         """Set the command dispatcher."""
@@ -0,0 +1,81 @@
+"""
+Handler Utilities
+=================
+Helpers shared by the command handler modules.
+"""
+
+import bpy
+from typing import Dict, Optional
+
+from common.exceptions import ObjectNotFoundError
+
+
+# Name -> Object cache for hot lookups. Dropped wholesale whenever the
+# generation changes (depsgraph update or file load); individual hits are
+# also validated since bpy structs don't support weak references.
+_obj_cache: Dict[str, "bpy.types.Object"] = {}
+_generation = 0
+_cache_generation = 0
+
+
+@bpy.app.handlers.persistent
+def _invalidate_obj_cache(*args):
+    """Depsgraph/load handler that invalidates the object cache."""
+    global _generation
+    _generation += 1
+
+
+def register_cache_handlers():
+    """Register the handlers that keep the object cache coherent."""
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+        if _invalidate_obj_cache not in handlers:
+            handlers.append(_invalidate_obj_cache)
+
+
+def unregister_cache_handlers():
+    """Unregister the object cache handlers and drop cached objects."""
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.load_post):
+        if _invalidate_obj_cache in handlers:
+            handlers.remove(_invalidate_obj_cache)
+    _obj_cache.clear()
+
+
+def generation() -> int:
+    """Get a counter that changes whenever the scene may have changed."""
+    return _generation
+
+
+def find_object(name: str) -> Optional["bpy.types.Object"]:
+    """Get an object by name, or None if it doesn't exist."""
+    global _cache_generation
+    if _cache_generation != _generation:
+        _obj_cache.clear()
+        _cache_generation = _generation
+    
+    obj = _obj_cache.get(name)
+    if obj is not None:
+        try:
+            if obj.name == name:
+                return obj
+        except ReferenceError:
+            # Object was removed behind our back
+            pass
+        del _obj_cache[name]
+    
+    obj = bpy.data.objects.get(name)
+    if obj is not None:
+        _obj_cache[name] = obj
+    return obj
+
+
+def require_object(name: str) -> "bpy.types.Object":
+    """Get an object by name, raising ObjectNotFoundError if missing."""
+    obj = find_object(name)
+    if obj is None:
+        raise ObjectNotFoundError(name)
+    return obj
+
+
+def forget_object(name: str):
+    """Drop a cached object (call before deleting or renaming it)."""
+    _obj_cache.pop(name, None)
@@ -6,11 +6,82 @@ Uses a simplified JSON-RPC 2.0 style protocol.
 """
 
 import json
-from dataclasses import dataclass, field, asdict
-from typing import Any, Optional, Dict
+import os
+from dataclasses import dataclass
+from typing import Any, Optional, Dict, Union, Iterator
 
+# Prefer orjson (C implementation) when available; set TDM_PURE_JSON=1 to
+# force the stdlib json module, e.g. inside hosts without orjson wheels.
+try:
+    if os.environ.get("TDM_PURE_JSON"):
+        raise ImportError("orjson disabled by TDM_PURE_JSON")
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+if orjson is not None:
+    def dumps(data: Any) -> bytes:
+        """Serialize data to compact JSON bytes."""
+        return orjson.dumps(data)
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """Parse JSON from str or bytes."""
+        return orjson.loads(data)
+else:
+    def dumps(data: Any) -> bytes:
+        """Serialize data to compact JSON bytes."""
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        """Parse JSON from str or bytes."""
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+# Wire protocol version. v1 is newline-delimited JSON; v2 adds optional
+# length-prefixed framing, negotiated per connection by sending FRAME_MAGIC
+# as the very first bytes (the server echoes it back to acknowledge).
+PROTOCOL_VERSION = 2
+FRAME_MAGIC = b"TDM\x02"
+FRAME_HEADER_SIZE = 4
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+
+def pack_frame(body: bytes) -> bytes:
+    """Prefix a message body with its 4-byte little-endian length."""
+    return len(body).to_bytes(FRAME_HEADER_SIZE, "little") + body
+
+
+def unpack_frames(buf: bytearray) -> Iterator[bytes]:
+    """
+    Yield complete frame bodies from a receive buffer.
+    
+    Consumed frames are removed from ``buf``; a trailing partial frame is
+    left in place for the next call.
+    
+    Raises:
+        ValueError: If a frame header announces more than MAX_FRAME_SIZE bytes
+    """
+    offset = 0
+    try:
+        while len(buf) - offset >= FRAME_HEADER_SIZE:
+            size = int.from_bytes(buf[offset:offset + FRAME_HEADER_SIZE], "little")
+            if size > MAX_FRAME_SIZE:
+                raise ValueError(f"Frame of {size} bytes exceeds limit of {MAX_FRAME_SIZE}")
+            end = offset + FRAME_HEADER_SIZE + size
+            if len(buf) < end:
+                break
+            body = bytes(buf[offset + FRAME_HEADER_SIZE:end])
+            offset = end
+            yield body
+    finally:
+        if offset:
+            del buf[:offset]
+
+
+@dataclass(slots=True)
 class Request:
     """
     Represents a JSON-RPC request message.
@@ -21,23 +92,39 @@ class Request:
         id: Optional request ID for correlation
     """
     method: str
-    params: Dict[str, Any] = field(default_factory=dict)
+    params: Optional[Dict[str, Any]] = None
     id: Optional[str] = None
     
-    def to_json(self) -> str:
-        """Serialize request to JSON string with newline delimiter."""
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the wire-format dictionary for this request."""
         data = {
             "method": self.method,
-            "params": self.params,
+            "params": {} if self.params is None else self.params,
         }
         if self.id is not None:
             data["id"] = self.id
-        return json.dumps(data) + "\n"
+        return data
+    
+    def encode(self) -> bytes:
+        """Serialize request to UTF-8 JSON bytes without a delimiter."""
+        return dumps(self.to_dict())
+    
+    def to_json(self) -> str:
+        """Serialize request to JSON string with newline delimiter."""
+        return self.encode().decode("utf-8") + "\n"
+    
+    def to_bytes(self) -> bytes:
+        """Serialize request to UTF-8 JSON bytes with newline delimiter."""
+        return self.encode() + b"\n"
+    
+    @classmethod
+    def from_json(cls, json_str: Union[str, bytes]) -> "Request":
+        """Parse a JSON string (or UTF-8 bytes) into a Request object."""
+        return cls.from_dict(loads(json_str))
     
     @classmethod
-    def from_json(cls, json_str: str) -> "Request":
-        """Parse a JSON string into a Request object."""
-        data = json.loads(json_str.strip())
+    def from_dict(cls, data: Dict[str, Any]) -> "Request":
+        """Build a Request object from an already-parsed message dictionary."""
         return cls(
             method=data.get("method", ""),
             params=data.get("params", {}),
@@ -45,7 +132,7 @@ class Request:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """
     Represents a successful JSON-RPC response message.
@@ -59,20 +146,36 @@ class Response:
     id: Optional[str] = None
     status: str = "success"
     
-    def to_json(self) -> str:
-        """Serialize response to JSON string with newline delimiter."""
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the wire-format dictionary for this response."""
         data = {
             "status": self.status,
             "result": self.result,
         }
         if self.id is not None:
             data["id"] = self.id
-        return json.dumps(data) + "\n"
+        return data
+    
+    def encode(self) -> bytes:
+        """Serialize response to UTF-8 JSON bytes without a delimiter."""
+        return dumps(self.to_dict())
+    
+    def to_json(self) -> str:
+        """Serialize response to JSON string with newline delimiter."""
+        return self.encode().decode("utf-8") + "\n"
+    
+    def to_bytes(self) -> bytes:
+        """Serialize response to UTF-8 JSON bytes with newline delimiter."""
+        return self.encode() + b"\n"
+    
+    @classmethod
+    def from_json(cls, json_str: Union[str, bytes]) -> "Response":
+        """Parse a JSON string (or UTF-8 bytes) into a Response object."""
+        return cls.from_dict(loads(json_str))
     
     @classmethod
-    def from_json(cls, json_str: str) -> "Response":
-        """Parse a JSON string into a Response object."""
-        data = json.loads(json_str.strip())
+    def from_dict(cls, data: Dict[str, Any]) -> "Response":
+        """Build a Response object from an already-parsed message dictionary."""
         return cls(
             status=data.get("status", "success"),
             result=data.get("result"),
@@ -80,7 +183,23 @@ class Response:
         )
 
 
-@dataclass
+# Error codes raised by the servers and common.exceptions
+KNOWN_ERROR_CODES = (
+    "COMMAND_ERROR", "CONNECTION_ERROR", "EXECUTION_ERROR", "EXPORT_ERROR",
+    "INTERNAL_ERROR", "MATERIAL_NOT_FOUND", "METHOD_NOT_FOUND",
+    "OBJECT_NOT_FOUND", "PARSE_ERROR", "RECEIVE_ERROR", "RENDER_ERROR",
+    "SERVER_ERROR", "SERVER_NOT_READY", "TIMEOUT_ERROR", "VALIDATION_ERROR",
+)
+
+# Pre-encoded JSON prefixes for the common error shape; only the message
+# and id still need serializing per response
+_ERROR_TEMPLATES = {
+    code: b'{"status":"error","error":{"code":"' + code.encode("ascii") + b'","message":'
+    for code in KNOWN_ERROR_CODES
+}
+
+
+@dataclass(slots=True)
 class ErrorResponse:
     """
     Represents an error JSON-RPC response message.
@@ -92,28 +211,52 @@ class ErrorResponse:
     """
     code: str
     message: str
-    details: Dict[str, Any] = field(default_factory=dict)
+    details: Optional[Dict[str, Any]] = None
     id: Optional[str] = None
     status: str = "error"
     
-    def to_json(self) -> str:
-        """Serialize error response to JSON string with newline delimiter."""
+    def to_dict(self) -> Dict[str, Any]:
+        """Build the wire-format dictionary for this error response."""
         data = {
             "status": self.status,
             "error": {
                 "code": self.code,
                 "message": self.message,
-                "details": self.details,
+                "details": {} if self.details is None else self.details,
             },
         }
         if self.id is not None:
             data["id"] = self.id
-        return json.dumps(data) + "\n"
+        return data
+    
+    def encode(self) -> bytes:
+        """Serialize error response to UTF-8 JSON bytes without a delimiter."""
+        template = _ERROR_TEMPLATES.get(self.code)
+        if template is None or self.details or self.status != "error":
+            return dumps(self.to_dict())
+        
+        # Fast path: splice into the pre-encoded prefix
+        body = template + dumps(self.message) + b',"details":{}}'
+        if self.id is not None:
+            body += b',"id":' + dumps(self.id)
+        return body + b'}'
+    
+    def to_json(self) -> str:
+        """Serialize error response to JSON string with newline delimiter."""
+        return self.encode().decode("utf-8") + "\n"
+    
+    def to_bytes(self) -> bytes:
+        """Serialize error response to UTF-8 JSON bytes with newline delimiter."""
+        return self.encode() + b"\n"
     
     @classmethod
-    def from_json(cls, json_str: str) -> "ErrorResponse":
-        """Parse a JSON string into an ErrorResponse object."""
-        data = json.loads(json_str.strip())
+    def from_json(cls, json_str: Union[str, bytes]) -> "ErrorResponse":
+        """Parse a JSON string (or UTF-8 bytes) into an ErrorResponse object."""
+        return cls.from_dict(loads(json_str))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ErrorResponse":
+        """Build an ErrorResponse object from an already-parsed message dictionary."""
         error = data.get("error", {})
         return cls(
             status=data.get("status", "error"),
@@ -124,7 +267,19 @@ class ErrorResponse:
         )
 
 
-def parse_message(json_str: str) -> Request | Response | ErrorResponse:
+def encode_success(result: Any, id: Optional[str] = None) -> bytes:
+    """
+    Serialize a success response body without building a Response object.
+    
+    Produces the same bytes as ``Response(result, id).encode()``; meant for
+    server hot paths.
+    """
+    if id is None:
+        return dumps({"status": "success", "result": result})
+    return dumps({"status": "success", "result": result, "id": id})
+
+
+def parse_message(json_str: Union[str, bytes]) -> Request | Response | ErrorResponse:
     """
     Parse a JSON string into the appropriate message type.
     
@@ -134,11 +289,11 @@ def parse_message(json_str: str) -> Request | Response | ErrorResponse:
     Returns:
         Request, Response, or ErrorResponse depending on content
     """
-    data = json.loads(json_str.strip())
+    data = loads(json_str)
     
     if "method" in data:
-        return Request.from_json(json_str)
+        return Request.from_dict(data)
     elif data.get("status") == "error":
-        return ErrorResponse.from_json(json_str)
+        return ErrorResponse.from_dict(data)
     else:
-        return Response.from_json(json_str)
+        return Response.from_dict(data)
@@ -30,11 +30,14 @@ def parse_args():
     # Support environment variables for configuration
     host = os.environ.get('FREECAD_SERVER_HOST', '127.0.0.1')
     port = int(os.environ.get('FREECAD_SERVER_PORT', '9877'))
+    max_accepts = int(os.environ.get('FREECAD_SERVER_MAX_ACCEPTS', os.cpu_count() or 1))
     
     # Also try command line args if available
     parser = argparse.ArgumentParser(description='FreeCAD Socket Server')
     parser.add_argument('--host', default=host, help='Host to bind to')
     parser.add_argument('--port', type=int, default=port, help='Port to listen on')
+    parser.add_argument('--max-accepts', type=int, default=max_accepts,
+                        help='Most connections accepted per listener wakeup')
     
     # Find args after --
     try:
@@ -47,6 +50,7 @@ def parse_args():
         args = Args()
         args.host = host
         args.port = port
+        args.max_accepts = max_accepts
         
     return args
 
@@ -73,7 +77,9 @@ def main():
     from server.handlers import get_dispatcher
     
     # Create and configure server
-    server = FreeCADSocketServer(host=args.host, port=args.port)
+    server = FreeCADSocketServer(
+        host=args.host, port=args.port, max_accepts=args.max_accepts
+    )
     server.set_dispatcher(get_dispatcher())
     
     # Setup signal handlers
@@ -4,64 +4,180 @@ FreeCAD Boolean Operations Handlers
 Handlers for boolean operations (union, subtract, intersect).
 """
 
+import math
 from typing import Optional, List, Dict, Any
-from .handlers import handler
+
+import FreeCAD
+import Part
+
+from common.exceptions import ObjectNotFoundError
+
+from .handlers import handler, schedule_recompute
+from .cache import cached_shape_op, find_object, forget_object, touch_document
+
+# Constant vectors, built once; shape operations don't modify their arguments
+_ORIGIN = FreeCAD.Vector(0, 0, 0)
+_DEFAULT_AXIS = FreeCAD.Vector(0, 0, 1)
+
+# Mirror plane name -> (point on plane, plane normal)
+_MIRROR_PLANES = {
+    "XY": (_ORIGIN, FreeCAD.Vector(0, 0, 1)),
+    "XZ": (_ORIGIN, FreeCAD.Vector(0, 1, 0)),
+    "YZ": (_ORIGIN, FreeCAD.Vector(1, 0, 0)),
+}
 
 
 def _ensure_document():
     """Ensure a document exists."""
-    import FreeCAD
-    if FreeCAD.ActiveDocument is None:
-        FreeCAD.newDocument("Unnamed")
-    return FreeCAD.ActiveDocument
+    doc = FreeCAD.ActiveDocument
+    if doc is None:
+        doc = FreeCAD.newDocument("Unnamed")
+    return doc
 
 
 def _get_object(name: str):
     """Get an object by name, raising error if not found."""
-    import FreeCAD
-    from common.exceptions import ObjectNotFoundError
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         raise ObjectNotFoundError(name)
         
-    obj = doc.getObject(name)
+    obj = find_object(doc, name)
     if obj is None:
         raise ObjectNotFoundError(name)
         
     return obj
 
 
-def _add_object_to_doc(shape, name: str, doc=None):
-    """Add a shape to the document as a Part::Feature."""
-    import FreeCAD
+def _add_object_to_doc(shape, name: str, doc=None, skip_recompute: bool = True):
+    """
+    Add a shape to the document as a Part::Feature.
     
+    A plain Part::Feature holding an already computed shape has no links or
+    expressions, so by default its touched flag is purged instead of
+    recomputing the whole document. Pass skip_recompute=False for objects
+    that do need a recompute.
+    """
     if doc is None:
         doc = _ensure_document()
         
     obj = doc.addObject("Part::Feature", name)
     obj.Shape = shape
-    doc.recompute()
+    touch_document(doc)
+    if skip_recompute:
+        obj.purgeTouched()
+    else:
+        schedule_recompute(doc)
     
     return obj
 
 
 def _get_bounding_box(shape) -> dict:
     """Get bounding box of a shape."""
+    # Tuples serialize like lists but skip list over-allocation; the size is
+    # derived from the extents instead of three more property fetches
     bb = shape.BoundBox
+    xmin, ymin, zmin = bb.XMin, bb.YMin, bb.ZMin
+    xmax, ymax, zmax = bb.XMax, bb.YMax, bb.ZMax
     return {
-        "min": [bb.XMin, bb.YMin, bb.ZMin],
-        "max": [bb.XMax, bb.YMax, bb.ZMax],
-        "size": [bb.XLength, bb.YLength, bb.ZLength]
+        "min": (xmin, ymin, zmin),
+        "max": (xmax, ymax, zmax),
+        "size": (xmax - xmin, ymax - ymin, zmax - zmin)
     }
 
 
+def _get_edges(shape) -> list:
+    """
+    Get a shape's edges as a list, reusing it for the same shape.
+    
+    Shape.Edges rebuilds every edge wrapper on each access, so repeated
+    fillets/chamfers on one shape (e.g. trying different radii) share it.
+    """
+    return cached_shape_op("edges", (shape,), (), lambda: shape.Edges)
+
+
+def _boxes_overlap(bb1, bb2, fuzzy: Optional[float] = None) -> bool:
+    """
+    Check whether two bounding boxes intersect, within the fuzzy gap if set.
+    
+    Shapes closer than the fuzzy tolerance are glued by the boolean, so
+    they must not be treated as disjoint.
+    """
+    if fuzzy:
+        # Shape.BoundBox returns a copy, so enlarging it is safe
+        bb1.enlarge(fuzzy)
+    return bb1.intersect(bb2)
+
+
+def _fuse(acc, nxt, fuzzy: Optional[float] = None):
+    """
+    Fuse two shapes, skipping the boolean when their bounding boxes are disjoint.
+    
+    Disjoint inputs are gathered into a compound instead, which is a valid
+    union without running OCCT's pave filler. If acc is such a compound,
+    nxt is tested against each member's bounding box.
+    """
+    bb = nxt.BoundBox
+    parts = acc.childShapes() if acc.ShapeType == "Compound" else [acc]
+    if any(_boxes_overlap(part.BoundBox, bb, fuzzy) for part in parts):
+        return acc.fuse(nxt, fuzzy) if fuzzy else acc.fuse(nxt)
+    return Part.makeCompound(parts + [nxt])
+
+
+def _cut(acc, tool, fuzzy: Optional[float] = None):
+    """Cut tool from acc, skipping the boolean when their bounding boxes are disjoint."""
+    if _boxes_overlap(acc.BoundBox, tool.BoundBox, fuzzy):
+        return acc.cut(tool, fuzzy) if fuzzy else acc.cut(tool)
+    return acc
+
+
+def _common(shape1, shape2, fuzzy: Optional[float] = None):
+    """Intersect two shapes, optionally with a fuzzy tolerance."""
+    return shape1.common(shape2, fuzzy) if fuzzy else shape1.common(shape2)
+
+
+def _accumulate(op: str, step, shapes: list, fuzzy: Optional[float], refine: bool):
+    """
+    Fold shapes[1:] into shapes[0] with a pairwise boolean step.
+    
+    Each prefix is looked up in the op cache, so a later call with a superset
+    of these inputs picks up from an earlier result, but only the final
+    result is stored. Intermediates are released as soon as the next step
+    is done, which bounds peak memory for long input lists.
+    
+    Args:
+        op: Op cache name for the step ("fuse" or "cut")
+        step: Callable(acc, nxt, fuzzy) performing one boolean
+        shapes: Input shapes, at least two
+        fuzzy: Optional fuzzy tolerance
+        refine: Run removeSplitter() on the final result only
+        
+    Returns:
+        The result shape
+    """
+    result_shape = shapes[0]
+    last = len(shapes) - 1
+    for i in range(1, len(shapes)):
+        result_shape = cached_shape_op(
+            op, shapes[:i + 1], (fuzzy,),
+            lambda acc=result_shape, nxt=shapes[i]: step(acc, nxt, fuzzy),
+            store=i == last
+        )
+    
+    if refine:
+        # Unifying same-domain faces is expensive; never do it between steps
+        result_shape = cached_shape_op(
+            "refine", (result_shape,), (), result_shape.removeSplitter
+        )
+    return result_shape
+
+
 @handler("boolean_union")
 def boolean_union(
     object1: str,
     object2: str,
     name: str = "Union",
-    delete_originals: bool = False
+    delete_originals: bool = False,
+    fuzzy: Optional[float] = None
 ) -> dict:
     """
     Perform boolean union (fuse) of two objects.
@@ -71,31 +187,36 @@ def boolean_union(
         object2: Second object name
         name: Name for the result object
         delete_originals: Whether to delete the original objects
+        fuzzy: Optional fuzzy tolerance for nearly coincident faces
         
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     
     obj1 = _get_object(object1)
     obj2 = _get_object(object2)
     
-    result_shape = obj1.Shape.fuse(obj2.Shape)
+    shape1, shape2 = obj1.Shape, obj2.Shape
+    result_shape = cached_shape_op(
+        "fuse", (shape1, shape2), (fuzzy,), lambda: _fuse(shape1, shape2, fuzzy)
+    )
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     if delete_originals:
+        forget_object(doc, object1)
         doc.removeObject(object1)
+        forget_object(doc, object2)
         doc.removeObject(object2)
-        doc.recompute()
+        # Objects depending on the removed originals need updating
+        schedule_recompute(doc)
     
     return {
         "object_id": result_obj.Name,
         "type": "Union",
         "inputs": [object1, object2],
-        "bounding_box": _get_bounding_box(result_obj.Shape),
-        "volume": result_obj.Shape.Volume
+        "bounding_box": _get_bounding_box(result_shape),
+        "volume": result_shape.Volume
     }
 
 
@@ -104,7 +225,8 @@ def boolean_subtract(
     base: str,
     tool: str,
     name: str = "Subtract",
-    delete_originals: bool = False
+    delete_originals: bool = False,
+    fuzzy: Optional[float] = None
 ) -> dict:
     """
     Perform boolean subtraction (cut) of two objects.
@@ -114,32 +236,37 @@ def boolean_subtract(
         tool: Tool object name (to cut with)
         name: Name for the result object
         delete_originals: Whether to delete the original objects
+        fuzzy: Optional fuzzy tolerance for nearly coincident faces
         
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     
     base_obj = _get_object(base)
     tool_obj = _get_object(tool)
     
-    result_shape = base_obj.Shape.cut(tool_obj.Shape)
+    base_shape, tool_shape = base_obj.Shape, tool_obj.Shape
+    result_shape = cached_shape_op(
+        "cut", (base_shape, tool_shape), (fuzzy,), lambda: _cut(base_shape, tool_shape, fuzzy)
+    )
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     if delete_originals:
+        forget_object(doc, base)
         doc.removeObject(base)
+        forget_object(doc, tool)
         doc.removeObject(tool)
-        doc.recompute()
+        # Objects depending on the removed originals need updating
+        schedule_recompute(doc)
     
     return {
         "object_id": result_obj.Name,
         "type": "Subtract",
         "base": base,
         "tool": tool,
-        "bounding_box": _get_bounding_box(result_obj.Shape),
-        "volume": result_obj.Shape.Volume
+        "bounding_box": _get_bounding_box(result_shape),
+        "volume": result_shape.Volume
     }
 
 
@@ -148,7 +275,8 @@ def boolean_intersect(
     object1: str,
     object2: str,
     name: str = "Intersect",
-    delete_originals: bool = False
+    delete_originals: bool = False,
+    fuzzy: Optional[float] = None
 ) -> dict:
     """
     Perform boolean intersection (common) of two objects.
@@ -158,31 +286,36 @@ def boolean_intersect(
         object2: Second object name
         name: Name for the result object
         delete_originals: Whether to delete the original objects
+        fuzzy: Optional fuzzy tolerance for nearly coincident faces
         
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     
     obj1 = _get_object(object1)
     obj2 = _get_object(object2)
     
-    result_shape = obj1.Shape.common(obj2.Shape)
+    shape1, shape2 = obj1.Shape, obj2.Shape
+    result_shape = cached_shape_op(
+        "common", (shape1, shape2), (fuzzy,), lambda: _common(shape1, shape2, fuzzy)
+    )
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     if delete_originals:
+        forget_object(doc, object1)
         doc.removeObject(object1)
+        forget_object(doc, object2)
         doc.removeObject(object2)
-        doc.recompute()
+        # Objects depending on the removed originals need updating
+        schedule_recompute(doc)
     
     return {
         "object_id": result_obj.Name,
         "type": "Intersect",
         "inputs": [object1, object2],
-        "bounding_box": _get_bounding_box(result_obj.Shape),
-        "volume": result_obj.Shape.Volume
+        "bounding_box": _get_bounding_box(result_shape),
+        "volume": result_shape.Volume
     }
 
 
@@ -190,7 +323,9 @@ def boolean_intersect(
 def multi_union(
     objects: List[str],
     name: str = "MultiUnion",
-    delete_originals: bool = False
+    delete_originals: bool = False,
+    fuzzy: Optional[float] = None,
+    refine: bool = False
 ) -> dict:
     """
     Perform boolean union of multiple objects.
@@ -199,38 +334,38 @@ def multi_union(
         objects: List of object names to union
         name: Name for the result object
         delete_originals: Whether to delete the original objects
+        fuzzy: Optional fuzzy tolerance for nearly coincident faces
+        refine: Merge coplanar faces of the final result (removeSplitter)
         
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
+    # Fusing a shape with itself is wasted (and fragile) OCCT work
+    objects = list(dict.fromkeys(objects))
     if len(objects) < 2:
-        raise ValueError("At least 2 objects required for multi_union")
+        raise ValueError("At least 2 distinct objects required for multi_union")
         
     doc = _ensure_document()
     
-    # Start with first object
-    result_shape = _get_object(objects[0]).Shape.copy()
+    shapes = [_get_object(obj_name).Shape for obj_name in objects]
     
-    # Fuse with remaining objects
-    for obj_name in objects[1:]:
-        obj = _get_object(obj_name)
-        result_shape = result_shape.fuse(obj.Shape)
+    result_shape = _accumulate("fuse", _fuse, shapes, fuzzy, refine)
         
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     if delete_originals:
         for obj_name in objects:
+            forget_object(doc, obj_name)
             doc.removeObject(obj_name)
-        doc.recompute()
+        # Objects depending on the removed originals need updating
+        schedule_recompute(doc)
     
     return {
         "object_id": result_obj.Name,
         "type": "MultiUnion",
         "inputs": objects,
-        "bounding_box": _get_bounding_box(result_obj.Shape),
-        "volume": result_obj.Shape.Volume
+        "bounding_box": _get_bounding_box(result_shape),
+        "volume": result_shape.Volume
     }
 
 
@@ -239,7 +374,9 @@ def multi_subtract(
     base: str,
     tools: List[str],
     name: str = "MultiSubtract",
-    delete_originals: bool = False
+    delete_originals: bool = False,
+    fuzzy: Optional[float] = None,
+    refine: bool = False
 ) -> dict:
     """
     Perform boolean subtraction of multiple tools from a base.
@@ -249,40 +386,41 @@ def multi_subtract(
         tools: List of tool object names to subtract
         name: Name for the result object
         delete_originals: Whether to delete the original objects
+        fuzzy: Optional fuzzy tolerance for nearly coincident faces
+        refine: Merge coplanar faces of the final result (removeSplitter)
         
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
+    # Cutting the same tool twice is a no-op the second time
+    tools = list(dict.fromkeys(tools))
     if len(tools) < 1:
         raise ValueError("At least 1 tool required for multi_subtract")
         
     doc = _ensure_document()
     
-    # Start with base object
-    result_shape = _get_object(base).Shape.copy()
+    shapes = [_get_object(base).Shape] + [_get_object(t).Shape for t in tools]
     
-    # Cut with each tool
-    for tool_name in tools:
-        tool_obj = _get_object(tool_name)
-        result_shape = result_shape.cut(tool_obj.Shape)
+    result_shape = _accumulate("cut", _cut, shapes, fuzzy, refine)
         
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     if delete_originals:
+        forget_object(doc, base)
         doc.removeObject(base)
         for tool_name in tools:
+            forget_object(doc, tool_name)
             doc.removeObject(tool_name)
-        doc.recompute()
+        # Objects depending on the removed originals need updating
+        schedule_recompute(doc)
     
     return {
         "object_id": result_obj.Name,
         "type": "MultiSubtract",
         "base": base,
         "tools": tools,
-        "bounding_box": _get_bounding_box(result_obj.Shape),
-        "volume": result_obj.Shape.Volume
+        "bounding_box": _get_bounding_box(result_shape),
+        "volume": result_shape.Volume
     }
 
 
@@ -305,17 +443,23 @@ def extrude(
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     obj = _get_object(object_name)
     
-    # Normalize direction and scale by length
-    dir_vec = FreeCAD.Vector(*direction)
-    dir_vec.normalize()
-    dir_vec = dir_vec * length
-    
-    result_shape = obj.Shape.extrude(dir_vec)
+    # Normalize direction and scale by length in Python, then build the
+    # Vector once instead of normalize() and multiply round-trips
+    x, y, z = direction
+    norm = math.hypot(x, y, z)
+    if norm == 0:
+        raise ValueError("Extrusion direction must not be a zero vector")
+    scale = length / norm
+    offset = (x * scale, y * scale, z * scale)
+    dir_vec = FreeCAD.Vector(*offset)
+    
+    shape = obj.Shape
+    result_shape = cached_shape_op(
+        "extrude", (shape,), offset, lambda: shape.extrude(dir_vec)
+    )
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     return {
@@ -324,7 +468,7 @@ def extrude(
         "source": object_name,
         "direction": direction,
         "length": length,
-        "bounding_box": _get_bounding_box(result_obj.Shape)
+        "bounding_box": _get_bounding_box(result_shape)
     }
 
 
@@ -349,15 +493,17 @@ def revolve(
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     obj = _get_object(object_name)
     
-    axis_vec = FreeCAD.Vector(*(axis or [0, 0, 1]))
-    point_vec = FreeCAD.Vector(*(axis_point or [0, 0, 0]))
+    axis_vec = FreeCAD.Vector(*axis) if axis else _DEFAULT_AXIS
+    point_vec = FreeCAD.Vector(*axis_point) if axis_point else _ORIGIN
     
-    result_shape = obj.Shape.revolve(point_vec, axis_vec, angle)
+    shape = obj.Shape
+    result_shape = cached_shape_op(
+        "revolve", (shape,), (tuple(point_vec), tuple(axis_vec), angle),
+        lambda: shape.revolve(point_vec, axis_vec, angle)
+    )
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     return {
@@ -365,7 +511,7 @@ def revolve(
         "type": "Revolve",
         "source": object_name,
         "angle": angle,
-        "bounding_box": _get_bounding_box(result_obj.Shape)
+        "bounding_box": _get_bounding_box(result_shape)
     }
 
 
@@ -388,17 +534,18 @@ def fillet(
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     obj = _get_object(object_name)
     
-    if edge_indices is None:
-        edges = obj.Shape.Edges
-    else:
-        edges = [obj.Shape.Edges[i] for i in edge_indices]
-        
-    result_shape = obj.Shape.makeFillet(radius, edges)
+    shape = obj.Shape
+    
+    def build():
+        all_edges = _get_edges(shape)
+        edges = all_edges if edge_indices is None else [all_edges[i] for i in edge_indices]
+        return shape.makeFillet(radius, edges)
+    
+    indices = None if edge_indices is None else tuple(edge_indices)
+    result_shape = cached_shape_op("fillet", (shape,), (radius, indices), build)
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     return {
@@ -406,7 +553,7 @@ def fillet(
         "type": "Fillet",
         "source": object_name,
         "radius": radius,
-        "bounding_box": _get_bounding_box(result_obj.Shape)
+        "bounding_box": _get_bounding_box(result_shape)
     }
 
 
@@ -429,17 +576,18 @@ def chamfer(
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     obj = _get_object(object_name)
     
-    if edge_indices is None:
-        edges = obj.Shape.Edges
-    else:
-        edges = [obj.Shape.Edges[i] for i in edge_indices]
-        
-    result_shape = obj.Shape.makeChamfer(size, edges)
+    shape = obj.Shape
+    
+    def build():
+        all_edges = _get_edges(shape)
+        edges = all_edges if edge_indices is None else [all_edges[i] for i in edge_indices]
+        return shape.makeChamfer(size, edges)
+    
+    indices = None if edge_indices is None else tuple(edge_indices)
+    result_shape = cached_shape_op("chamfer", (shape,), (size, indices), build)
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     return {
@@ -447,7 +595,7 @@ def chamfer(
         "type": "Chamfer",
         "source": object_name,
         "size": size,
-        "bounding_box": _get_bounding_box(result_obj.Shape)
+        "bounding_box": _get_bounding_box(result_shape)
     }
 
 
@@ -468,23 +616,18 @@ def mirror(
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     obj = _get_object(object_name)
     
-    # Define mirror planes
-    planes = {
-        "XY": (FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1)),
-        "XZ": (FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 1, 0)),
-        "YZ": (FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(1, 0, 0)),
-    }
-    
-    if plane.upper() not in planes:
+    plane_key = plane.upper()
+    if plane_key not in _MIRROR_PLANES:
         raise ValueError(f"Invalid plane: {plane}. Use XY, XZ, or YZ")
         
-    point, normal = planes[plane.upper()]
-    result_shape = obj.Shape.mirror(point, normal)
+    point, normal = _MIRROR_PLANES[plane_key]
+    shape = obj.Shape
+    result_shape = cached_shape_op(
+        "mirror", (shape,), (plane_key,), lambda: shape.mirror(point, normal)
+    )
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     return {
@@ -492,7 +635,7 @@ def mirror(
         "type": "Mirror",
         "source": object_name,
         "plane": plane,
-        "bounding_box": _get_bounding_box(result_obj.Shape)
+        "bounding_box": _get_bounding_box(result_shape)
     }
 
 
@@ -513,12 +656,13 @@ def offset(
     Returns:
         dict with result object info
     """
-    import FreeCAD
-    
     doc = _ensure_document()
     obj = _get_object(object_name)
     
-    result_shape = obj.Shape.makeOffsetShape(distance, 0.01)
+    shape = obj.Shape
+    result_shape = cached_shape_op(
+        "offset", (shape,), (distance, 0.01), lambda: shape.makeOffsetShape(distance, 0.01)
+    )
     result_obj = _add_object_to_doc(result_shape, name, doc)
     
     return {
@@ -526,5 +670,5 @@ def offset(
         "type": "Offset",
         "source": object_name,
         "distance": distance,
-        "bounding_box": _get_bounding_box(result_obj.Shape)
+        "bounding_box": _get_bounding_box(result_shape)
     }
@@ -0,0 +1,164 @@
+"""
+FreeCAD Server Caches
+
+Content-addressed cache for expensive shape operations (booleans, fillets,
+extrusions, ...). Results are keyed by operation name, the input shapes and
+the operation parameters, so repeating an operation on unchanged inputs
+skips the OCCT computation.
+
+Also caches shape validity checks, document object lookups by name and
+each document's list of shape-bearing objects.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Maximum number of cached operation results (least recently used go first)
+MAX_OP_CACHE_ENTRIES = 128
+
+# (op, input hash codes, params) -> (input shapes, result shape)
+_op_cache: "OrderedDict[tuple, Tuple[tuple, Any]]" = OrderedDict()
+
+
+def cached_shape_op(
+    op: str,
+    inputs: Sequence,
+    params: Hashable,
+    build: Callable[[], Any],
+    store: bool = True
+):
+    """
+    Return the cached result of a shape operation, building it on a miss.
+    
+    Args:
+        op: Operation name (e.g. "fuse", "cut", "fillet")
+        inputs: Input shapes, in operation order
+        params: Hashable tuple of the operation's other arguments
+        build: Zero-argument callable that computes the result shape
+        store: If False, a freshly built result is returned without being
+               cached (for short-lived intermediates)
+    
+    Returns:
+        The result shape
+    """
+    inputs = tuple(inputs)
+    key = (op, tuple(shape.hashCode() for shape in inputs), params)
+    
+    entry = _op_cache.get(key)
+    # Hash codes can collide, so confirm the inputs are really the same shapes
+    if entry is not None and all(a.isSame(b) for a, b in zip(entry[0], inputs)):
+        _op_cache.move_to_end(key)
+        return entry[1]
+    
+    result = build()
+    if not store:
+        return result
+    _op_cache[key] = (inputs, result)
+    if len(_op_cache) > MAX_OP_CACHE_ENTRIES:
+        _op_cache.popitem(last=False)
+    return result
+
+
+def clear_op_cache() -> None:
+    """Drop all cached operation results and validity checks."""
+    _op_cache.clear()
+    _valid_cache.clear()
+
+
+# Maximum number of cached validity checks (least recently used go first)
+MAX_VALID_CACHE_ENTRIES = 1024
+
+# Shape hash code -> (shape, isValid() result)
+_valid_cache: "OrderedDict[int, Tuple[Any, bool]]" = OrderedDict()
+
+
+def shape_is_valid(shape) -> bool:
+    """
+    Check a shape with isValid(), reusing the result for the same shape.
+    
+    isValid() runs a full BRepCheck traversal, so repeated exports of
+    unchanged shapes only pay for it once.
+    """
+    key = shape.hashCode()
+    entry = _valid_cache.get(key)
+    if entry is not None and entry[0].isSame(shape):
+        _valid_cache.move_to_end(key)
+        return entry[1]
+    
+    valid = shape.isValid()
+    _valid_cache[key] = (shape, valid)
+    if len(_valid_cache) > MAX_VALID_CACHE_ENTRIES:
+        _valid_cache.popitem(last=False)
+    return valid
+
+
+# Document name -> {object name: DocumentObject}
+_object_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def find_object(doc, name: str) -> Optional[Any]:
+    """
+    Get an object from a document by name, or None if it doesn't exist.
+    
+    Hits are validated, so objects removed behind the cache's back (e.g. by
+    execute_python) are looked up again rather than returned.
+    """
+    objects = _object_cache.get(doc.Name)
+    if objects is None:
+        objects = _object_cache[doc.Name] = {}
+    
+    obj = objects.get(name)
+    if obj is not None:
+        try:
+            if obj.Name == name:
+                return obj
+        except Exception:
+            # Deleted objects raise on attribute access
+            pass
+        del objects[name]
+    
+    obj = doc.getObject(name)
+    if obj is not None:
+        objects[name] = obj
+    return obj
+
+
+def forget_object(doc, name: str) -> None:
+    """Drop a cached object (call when removing it from the document)."""
+    objects = _object_cache.get(doc.Name)
+    if objects is not None:
+        objects.pop(name, None)
+    touch_document(doc)
+
+
+# Document name -> generation, bumped whenever objects are added or removed
+_doc_generations: Dict[str, int] = {}
+
+# Document name -> (generation, objects that have a Shape)
+_shaped_objects_cache: Dict[str, Tuple[int, List[Any]]] = {}
+
+
+def touch_document(doc) -> None:
+    """Record that objects were added to or removed from a document."""
+    _doc_generations[doc.Name] = _doc_generations.get(doc.Name, 0) + 1
+
+
+def shaped_objects(doc) -> List[Any]:
+    """
+    Get the document's objects that have a Shape, in document order.
+    
+    The filtered list is reused until touch_document() (or forget_object())
+    is called for the document.
+    """
+    generation = _doc_generations.get(doc.Name, 0)
+    cached = _shaped_objects_cache.get(doc.Name)
+    if cached is None or cached[0] != generation:
+        cached = (generation, [obj for obj in doc.Objects if hasattr(obj, 'Shape')])
+        _shaped_objects_cache[doc.Name] = cached
+    return list(cached[1])
+
+
+def clear_object_cache() -> None:
+    """Drop all cached object lookups and object lists."""
+    _object_cache.clear()
+    _shaped_objects_cache.clear()
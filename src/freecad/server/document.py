@@ -5,16 +5,19 @@ Handlers for document creation, saving, loading, and management.
 """
 
 from typing import Optional, List, Dict, Any
+
+import FreeCAD
+
 from .handlers import handler
+from .cache import clear_op_cache, clear_object_cache
 
 
 def _ensure_document(name: str = "Unnamed") -> "FreeCAD.Document":
     """Ensure a document exists, creating one if needed."""
-    import FreeCAD
-    
-    if FreeCAD.ActiveDocument is None:
-        return FreeCAD.newDocument(name)
-    return FreeCAD.ActiveDocument
+    doc = FreeCAD.ActiveDocument
+    if doc is None:
+        doc = FreeCAD.newDocument(name)
+    return doc
 
 
 @handler("new_document")
@@ -28,9 +31,9 @@ def new_document(name: str = "Unnamed") -> dict:
     Returns:
         dict with document info
     """
-    import FreeCAD
-    
     doc = FreeCAD.newDocument(name)
+    clear_op_cache()
+    clear_object_cache()
     
     return {
         "name": doc.Name,
@@ -48,8 +51,6 @@ def get_active_document() -> dict:
     Returns:
         dict with active document info or None if no document
     """
-    import FreeCAD
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         return {
@@ -75,8 +76,6 @@ def list_documents() -> dict:
     Returns:
         dict with list of document names
     """
-    import FreeCAD
-    
     docs = []
     for name in FreeCAD.listDocuments():
         doc = FreeCAD.getDocument(name)
@@ -104,8 +103,6 @@ def close_document(name: str) -> dict:
     Returns:
         dict with success status
     """
-    import FreeCAD
-    
     doc = FreeCAD.getDocument(name)
     if doc is None:
         return {
@@ -114,6 +111,8 @@ def close_document(name: str) -> dict:
         }
         
     FreeCAD.closeDocument(name)
+    clear_op_cache()
+    clear_object_cache()
     
     return {
         "success": True,
@@ -133,8 +132,6 @@ def save_document(filepath: str, name: Optional[str] = None) -> dict:
     Returns:
         dict with success status
     """
-    import FreeCAD
-    
     if name:
         doc = FreeCAD.getDocument(name)
     else:
@@ -166,9 +163,9 @@ def open_document(filepath: str) -> dict:
     Returns:
         dict with document info
     """
-    import FreeCAD
-    
     doc = FreeCAD.openDocument(filepath)
+    clear_op_cache()
+    clear_object_cache()
     
     return {
         "success": True,
@@ -190,8 +187,6 @@ def set_active_document(name: str) -> dict:
     Returns:
         dict with success status
     """
-    import FreeCAD
-    
     doc = FreeCAD.getDocument(name)
     if doc is None:
         return {
@@ -4,28 +4,45 @@ FreeCAD Export/Import Operations Handlers
 Handlers for exporting and importing various file formats.
 """
 
-from typing import Optional, List, Dict, Any
-from .handlers import handler
+import os
+import sys
+import time
+import uuid
+import threading
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import StringIO
+from types import CodeType
+from typing import Callable, Optional, List, Dict, Any
+
+import FreeCAD
+import Part
+import Mesh
+
+from common.exceptions import ObjectNotFoundError
+
+from .handlers import handler, schedule_recompute
+from .cache import (
+    cached_shape_op, find_object, shape_is_valid, shaped_objects, touch_document
+)
 
 
 def _ensure_document():
     """Ensure a document exists."""
-    import FreeCAD
-    if FreeCAD.ActiveDocument is None:
-        FreeCAD.newDocument("Unnamed")
-    return FreeCAD.ActiveDocument
+    doc = FreeCAD.ActiveDocument
+    if doc is None:
+        doc = FreeCAD.newDocument("Unnamed")
+    return doc
 
 
 def _get_object(name: str):
     """Get an object by name, raising error if not found."""
-    import FreeCAD
-    from common.exceptions import ObjectNotFoundError
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         raise ObjectNotFoundError(name)
         
-    obj = doc.getObject(name)
+    obj = find_object(doc, name)
     if obj is None:
         raise ObjectNotFoundError(name)
         
@@ -34,8 +51,6 @@ def _get_object(name: str):
 
 def _get_objects_or_all(object_names: Optional[List[str]] = None):
     """Get specified objects or all objects in document."""
-    import FreeCAD
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         return []
@@ -43,13 +58,185 @@ def _get_objects_or_all(object_names: Optional[List[str]] = None):
     if object_names:
         return [_get_object(name) for name in object_names]
     else:
-        return [obj for obj in doc.Objects if hasattr(obj, 'Shape')]
+        return shaped_objects(doc)
+
+
+def _tessellate(shape, tolerance: float):
+    """Tessellate a shape into (points, facets), reusing cached results."""
+    return cached_shape_op(
+        "tessellate", (shape,), (tolerance,), lambda: shape.tessellate(tolerance)
+    )
+
+
+def _combined_mesh(shapes: list, tolerance: float):
+    """
+    Build a single mesh from several shapes.
+    
+    The combined mesh is cached too, so re-exporting unchanged shapes only
+    writes the file. Callers must not modify the returned mesh.
+    """
+    def build():
+        # Concatenate all tessellations and build the mesh once, instead of
+        # merging per-shape meshes with addMesh()
+        points = []
+        facets = []
+        for shape in shapes:
+            shape_points, shape_facets = _tessellate(shape, tolerance)
+            offset = len(points)
+            points.extend(shape_points)
+            if offset:
+                facets.extend([(a + offset, b + offset, c + offset) for a, b, c in shape_facets])
+            else:
+                facets.extend(shape_facets)
+        return Mesh.Mesh((points, facets))
+    
+    return cached_shape_op("mesh", shapes, (tolerance,), build)
+
+
+# Background file writer for exports requested with background=True
+EXPORT_WORKERS = 1
+_export_pool: Optional[ThreadPoolExecutor] = None
+_export_jobs: Dict[str, Future] = {}
+
+# Seconds a finished job's status is kept for get_export_status
+EXPORT_JOB_TTL = 600.0
+# Job id -> time.monotonic() when the job finished
+_export_finished: Dict[str, float] = {}
+
+# OCCT's STEP/IGES writers keep their settings in process-global statics,
+# so file writes never overlap, on the handler thread or the worker
+_write_lock = threading.Lock()
+
+# Read size when hashing exported files
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def _compound_of(objs: list):
+    """Get the shape of a single object, or a compound of several."""
+    if len(objs) == 1:
+        return objs[0].Shape
+    # Part.Compound just adds the shapes with a BRep_Builder; makeCompound
+    # may also build element maps, which an export doesn't need
+    return Part.Compound([obj.Shape for obj in objs])
+
+
+def _file_info(filepath: str, checksum: bool) -> dict:
+    """
+    Describe a written export file.
+    
+    File contents never go into the JSON-RPC response; clients read the file
+    out of band and can verify it against the digest.
+    """
+    info = {"file_size": os.path.getsize(filepath)}
+    if checksum:
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        info["sha256"] = digest.hexdigest()
+    return info
+
+
+def _run_export(
+    write: Callable[[], Any],
+    result: dict,
+    background: bool,
+    checksum: bool = False
+) -> dict:
+    """
+    Run an export's file write, optionally on a background worker.
+    
+    The shape or mesh must already be prepared on the handler thread; only
+    the write itself is offloaded, so no document access happens off-thread.
+    
+    Args:
+        write: Zero-argument callable that writes the file
+        result: Response dict to return; its "filepath" is the written file
+        background: If True, return immediately with a job_id for
+                    get_export_status instead of waiting for the write
+        checksum: Also report the file's sha256 digest
+        
+    Returns:
+        The response dict
+    """
+    global _export_pool
+    filepath = result["filepath"]
+    
+    def write_and_describe() -> dict:
+        with _write_lock:
+            write()
+        return _file_info(filepath, checksum)
+    
+    if not background:
+        result.update(write_and_describe())
+        return result
+    
+    if _export_pool is None:
+        _export_pool = ThreadPoolExecutor(
+            max_workers=EXPORT_WORKERS, thread_name_prefix="tdm-export"
+        )
+    _prune_export_jobs()
+    job_id = uuid.uuid4().hex
+    future = _export_pool.submit(write_and_describe)
+    _export_jobs[job_id] = future
+    future.add_done_callback(lambda _, job_id=job_id: _mark_finished(job_id))
+    result["pending"] = True
+    result["job_id"] = job_id
+    return result
+
+
+def _mark_finished(job_id: str) -> None:
+    """Record when a background export finished (runs on the worker)."""
+    _export_finished[job_id] = time.monotonic()
+
+
+def _prune_export_jobs() -> None:
+    """Forget finished jobs whose status nobody asked for within EXPORT_JOB_TTL."""
+    cutoff = time.monotonic() - EXPORT_JOB_TTL
+    for job_id, finished in list(_export_finished.items()):
+        if finished < cutoff:
+            del _export_finished[job_id]
+            _export_jobs.pop(job_id, None)
+
+
+@handler("get_export_status")
+def get_export_status(job_id: str) -> dict:
+    """
+    Get the status of a background export.
+    
+    Finished jobs are forgotten once their status has been reported, or
+    after EXPORT_JOB_TTL seconds if it never is.
+    
+    Args:
+        job_id: Job id returned by an export with background=True
+        
+    Returns:
+        dict with job status
+    """
+    _prune_export_jobs()
+    future = _export_jobs.get(job_id)
+    if future is None:
+        return {"job_id": job_id, "found": False}
+    if not future.done():
+        return {"job_id": job_id, "found": True, "done": False}
+    
+    del _export_jobs[job_id]
+    _export_finished.pop(job_id, None)
+    error = future.exception()
+    status = {"job_id": job_id, "found": True, "done": True, "success": error is None}
+    if error is not None:
+        status["error"] = str(error)
+    else:
+        status.update(future.result())
+    return status
 
 
 @handler("export_step")
 def export_step(
     filepath: str,
-    objects: Optional[List[str]] = None
+    objects: Optional[List[str]] = None,
+    background: bool = False,
+    checksum: bool = False
 ) -> dict:
     """
     Export objects to STEP format.
@@ -57,32 +244,33 @@ def export_step(
     Args:
         filepath: Output file path (.step or .stp)
         objects: List of object names (all if None)
+        background: Write the file on a worker thread and return a job_id
+        checksum: Include the written file's sha256 digest
         
     Returns:
         dict with export info
     """
-    import Part
-    
     objs = _get_objects_or_all(objects)
     if not objs:
         return {"success": False, "message": "No objects to export"}
         
-    shapes = [obj.Shape for obj in objs]
-    Part.export(shapes, filepath)
+    shape = _compound_of(objs)
     
-    return {
+    return _run_export(lambda: shape.exportStep(filepath), {
         "success": True,
         "filepath": filepath,
         "format": "STEP",
         "object_count": len(objs),
         "objects": [obj.Name for obj in objs]
-    }
+    }, background, checksum)
 
 
 @handler("export_iges")
 def export_iges(
     filepath: str,
-    objects: Optional[List[str]] = None
+    objects: Optional[List[str]] = None,
+    background: bool = False,
+    checksum: bool = False
 ) -> dict:
     """
     Export objects to IGES format.
@@ -90,33 +278,34 @@ def export_iges(
     Args:
         filepath: Output file path (.iges or .igs)
         objects: List of object names (all if None)
+        background: Write the file on a worker thread and return a job_id
+        checksum: Include the written file's sha256 digest
         
     Returns:
         dict with export info
     """
-    import Part
-    
     objs = _get_objects_or_all(objects)
     if not objs:
         return {"success": False, "message": "No objects to export"}
         
-    shapes = [obj.Shape for obj in objs]
-    Part.export(shapes, filepath)
+    shape = _compound_of(objs)
     
-    return {
+    return _run_export(lambda: shape.exportIges(filepath), {
         "success": True,
         "filepath": filepath,
         "format": "IGES",
         "object_count": len(objs),
         "objects": [obj.Name for obj in objs]
-    }
+    }, background, checksum)
 
 
 @handler("export_stl")
 def export_stl(
     filepath: str,
     objects: Optional[List[str]] = None,
-    tolerance: float = 0.1
+    tolerance: float = 0.1,
+    background: bool = False,
+    checksum: bool = False
 ) -> dict:
     """
     Export objects to STL format.
@@ -125,41 +314,44 @@ def export_stl(
         filepath: Output file path (.stl)
         objects: List of object names (all if None)
         tolerance: Mesh tolerance for tessellation
+        background: Write the file on a worker thread and return a job_id
+        checksum: Include the written file's sha256 digest
         
     Returns:
         dict with export info
     """
-    import Mesh
-    
     objs = _get_objects_or_all(objects)
     if not objs:
         return {"success": False, "message": "No objects to export"}
         
-    # Create mesh from shapes using Mesh.export
+    # Mesh the valid shapes at the requested tolerance
     shapes = []
     for obj in objs:
-        if hasattr(obj, 'Shape') and obj.Shape.isValid():
-            shapes.append(obj)
+        if hasattr(obj, 'Shape'):
+            shape = obj.Shape
+            if shape_is_valid(shape):
+                shapes.append(shape)
             
-    if shapes:
-        Mesh.export(shapes, filepath)
-    else:
+    if not shapes:
         return {"success": False, "message": "No valid shapes to export"}
+    mesh = _combined_mesh(shapes, tolerance)
     
-    return {
+    return _run_export(lambda: mesh.write(filepath), {
         "success": True,
         "filepath": filepath,
         "format": "STL",
         "object_count": len(objs),
         "objects": [obj.Name for obj in objs]
-    }
+    }, background, checksum)
 
 
 @handler("export_obj")
 def export_obj(
     filepath: str,
     objects: Optional[List[str]] = None,
-    tolerance: float = 0.1
+    tolerance: float = 0.1,
+    background: bool = False,
+    checksum: bool = False
 ) -> dict:
     """
     Export objects to OBJ format.
@@ -168,42 +360,38 @@ def export_obj(
         filepath: Output file path (.obj)
         objects: List of object names (all if None)
         tolerance: Mesh tolerance for tessellation
+        background: Write the file on a worker thread and return a job_id
+        checksum: Include the written file's sha256 digest
         
     Returns:
         dict with export info
     """
-    import Mesh
-    
     objs = _get_objects_or_all(objects)
     if not objs:
         return {"success": False, "message": "No objects to export"}
         
     # Create mesh from shapes
-    meshes = []
-    for obj in objs:
-        if hasattr(obj, 'Shape'):
-            mesh = Mesh.Mesh(obj.Shape.tessellate(tolerance)[0])
-            meshes.append(mesh)
+    shapes = [obj.Shape for obj in objs if hasattr(obj, 'Shape')]
             
-    if meshes:
-        combined = meshes[0]
-        for m in meshes[1:]:
-            combined.addMesh(m)
-        combined.write(filepath)
+    if not shapes:
+        return {"success": False, "message": "No valid shapes to export"}
+    mesh = _combined_mesh(shapes, tolerance)
     
-    return {
+    return _run_export(lambda: mesh.write(filepath), {
         "success": True,
         "filepath": filepath,
         "format": "OBJ",
         "object_count": len(objs),
         "objects": [obj.Name for obj in objs]
-    }
+    }, background, checksum)
 
 
 @handler("export_brep")
 def export_brep(
     filepath: str,
-    objects: Optional[List[str]] = None
+    objects: Optional[List[str]] = None,
+    background: bool = False,
+    checksum: bool = False
 ) -> dict:
     """
     Export objects to BREP format.
@@ -211,32 +399,25 @@ def export_brep(
     Args:
         filepath: Output file path (.brep or .brp)
         objects: List of object names (all if None)
+        background: Write the file on a worker thread and return a job_id
+        checksum: Include the written file's sha256 digest
         
     Returns:
         dict with export info
     """
-    import Part
-    
     objs = _get_objects_or_all(objects)
     if not objs:
         return {"success": False, "message": "No objects to export"}
         
-    # Combine shapes if multiple
-    if len(objs) == 1:
-        shape = objs[0].Shape
-    else:
-        compound = Part.makeCompound([obj.Shape for obj in objs])
-        shape = compound
-        
-    shape.exportBrep(filepath)
+    shape = _compound_of(objs)
     
-    return {
+    return _run_export(lambda: shape.exportBrep(filepath), {
         "success": True,
         "filepath": filepath,
         "format": "BREP",
         "object_count": len(objs),
         "objects": [obj.Name for obj in objs]
-    }
+    }, background, checksum)
 
 
 @handler("import_step")
@@ -250,9 +431,6 @@ def import_step(filepath: str) -> dict:
     Returns:
         dict with import info
     """
-    import FreeCAD
-    import Part
-    
     doc = _ensure_document()
     
     # Import STEP file
@@ -262,7 +440,8 @@ def import_step(filepath: str) -> dict:
     # Add to document
     obj = doc.addObject("Part::Feature", "ImportedSTEP")
     obj.Shape = shape
-    doc.recompute()
+    touch_document(doc)
+    schedule_recompute(doc)
     
     return {
         "success": True,
@@ -284,16 +463,14 @@ def import_stl(filepath: str, name: str = "ImportedSTL") -> dict:
     Returns:
         dict with import info
     """
-    import FreeCAD
-    import Mesh
-    
     doc = _ensure_document()
     
     # Import STL as mesh
     mesh = Mesh.Mesh(filepath)
     obj = doc.addObject("Mesh::Feature", name)
     obj.Mesh = mesh
-    doc.recompute()
+    touch_document(doc)
+    schedule_recompute(doc)
     
     return {
         "success": True,
@@ -305,6 +482,40 @@ def import_stl(filepath: str, name: str = "ImportedSTL") -> dict:
     }
 
 
+# Globals every execute_python snippet starts from
+_BASE_EXEC_GLOBALS: Dict[str, Any] = {
+    'FreeCAD': FreeCAD,
+    'Part': Part,
+    'App': FreeCAD,
+    'Mesh': Mesh,
+    '__builtins__': __builtins__,
+}
+try:
+    import Draft
+    _BASE_EXEC_GLOBALS['Draft'] = Draft
+except ImportError:
+    pass
+
+# Compiled snippets keyed by source digest, so replayed code isn't recompiled
+MAX_CODE_CACHE_ENTRIES = 256
+_CODE_CACHE: "OrderedDict[bytes, CodeType]" = OrderedDict()
+
+
+def _compile_cached(code: str) -> CodeType:
+    """Compile a snippet, reusing the code object for previously seen source."""
+    digest = hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest()
+    compiled = _CODE_CACHE.get(digest)
+    if compiled is not None:
+        _CODE_CACHE.move_to_end(digest)
+        return compiled
+    
+    compiled = compile(code, f"<rpc-{digest.hex()}>", 'exec')
+    _CODE_CACHE[digest] = compiled
+    if len(_CODE_CACHE) > MAX_CODE_CACHE_ENTRIES:
+        _CODE_CACHE.popitem(last=False)
+    return compiled
+
+
 @handler("execute_python")
 def execute_python(code: str) -> dict:
     """
@@ -316,11 +527,6 @@ def execute_python(code: str) -> dict:
     Returns:
         dict with execution result
     """
-    import FreeCAD
-    import Part
-    import sys
-    from io import StringIO
-    
     # Capture stdout/stderr
     old_stdout = sys.stdout
     old_stderr = sys.stderr
@@ -331,29 +537,9 @@ def execute_python(code: str) -> dict:
     error = None
     
     try:
-        # Create execution context
-        exec_globals = {
-            'FreeCAD': FreeCAD,
-            'Part': Part,
-            'App': FreeCAD,
-            '__builtins__': __builtins__,
-        }
-        
-        # Try to import optional modules
-        try:
-            import Mesh
-            exec_globals['Mesh'] = Mesh
-        except:
-            pass
-            
-        try:
-            import Draft
-            exec_globals['Draft'] = Draft
-        except:
-            pass
-        
-        # Execute code
-        exec(code, exec_globals)
+        # Fresh namespace per call so snippets don't leak into each other
+        exec_globals = dict(_BASE_EXEC_GLOBALS)
+        exec(_compile_cached(code), exec_globals)
         result = exec_globals.get('result', None)
         
     except Exception as e:
@@ -363,6 +549,9 @@ def execute_python(code: str) -> dict:
         stderr_output = sys.stderr.getvalue()
         sys.stdout = old_stdout
         sys.stderr = old_stderr
+        # The snippet may have added or removed anything
+        if FreeCAD.ActiveDocument is not None:
+            touch_document(FreeCAD.ActiveDocument)
     
     response = {
         "success": error is None,
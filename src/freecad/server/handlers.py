@@ -4,8 +4,11 @@ FreeCAD Command Handlers
 Command dispatcher and handler registration for FreeCAD operations.
 """
 
+import threading
+from contextlib import contextmanager
 from typing import Dict, Any, Callable, Optional, List
-from functools import wraps
+
+from common.exceptions import MethodNotFoundError
 
 # Handler registry
 _handlers: Dict[str, Callable] = {}
@@ -19,14 +22,148 @@ def handler(method_name: str):
         method_name: The JSON-RPC method name to handle
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        _handlers[method_name] = wrapper
-        return wrapper
+        # Register the function itself so dispatch doesn't pay for a wrapper frame
+        _handlers[method_name] = func
+        return func
     return decorator
 
 
+class DeferralState:
+    """
+    One client's recompute deferral: the begin_batch nesting depth and the
+    documents awaiting a recompute (None while not deferring).
+    """
+    
+    __slots__ = ("depth", "docs")
+    
+    def __init__(self):
+        self.depth = 0
+        self.docs: Optional[Dict[str, Any]] = None
+
+
+# The deferral state of the client whose request is being handled. The
+# server sets it around each dispatch (see deferral_scope); code running
+# outside a scope gets a state of its own per thread.
+_deferred = threading.local()
+
+
+def _current_state() -> DeferralState:
+    """Get the deferral state handlers on this thread should use."""
+    state = getattr(_deferred, "state", None)
+    if state is None:
+        state = _deferred.state = DeferralState()
+    return state
+
+
+@contextmanager
+def deferral_scope(state: DeferralState):
+    """Run handlers in this block against a client's deferral state."""
+    previous = getattr(_deferred, "state", None)
+    _deferred.state = state
+    try:
+        yield
+    finally:
+        _deferred.state = previous
+
+
+def schedule_recompute(doc) -> None:
+    """
+    Recompute a document, or schedule it if recomputes are being deferred.
+    
+    Handlers should call this instead of doc.recompute() so batches can
+    collapse many recomputes into one per document.
+    """
+    docs = _current_state().docs
+    if docs is None:
+        doc.recompute()
+    else:
+        docs[doc.Name] = doc
+
+
+def _begin_deferral(state: DeferralState) -> int:
+    """Start (or nest) deferring recomputes; returns the new depth."""
+    state.depth += 1
+    if state.depth == 1:
+        state.docs = {}
+    return state.depth
+
+
+def _end_deferral(state: DeferralState) -> int:
+    """
+    Leave one level of deferral, recomputing scheduled documents at the outermost.
+    
+    Returns:
+        Number of documents recomputed
+    """
+    state.depth -= 1
+    if state.depth:
+        return 0
+    
+    docs, state.docs = state.docs, None
+    for doc in docs.values():
+        try:
+            doc.recompute()
+        except Exception as e:
+            # Document may have been closed later in the batch
+            print(f"Deferred recompute failed: {e}")
+    return len(docs)
+
+
+def close_deferral(state: DeferralState) -> int:
+    """
+    End every begin_batch bracket a client left open (e.g. on disconnect).
+    
+    Returns:
+        Number of documents recomputed
+    """
+    if not state.depth:
+        return 0
+    state.depth = 1
+    return _end_deferral(state)
+
+
+@contextmanager
+def deferred_recompute():
+    """Defer the current client's recomputes until the outermost block exits."""
+    state = _current_state()
+    _begin_deferral(state)
+    try:
+        yield
+    finally:
+        _end_deferral(state)
+
+
+@handler("begin_batch")
+def begin_batch() -> dict:
+    """
+    Defer document recomputes until the matching end_batch.
+    
+    Brackets may nest; only the outermost end_batch recomputes, once per
+    touched document. Brackets belong to the calling connection: they don't
+    affect other clients, and any left open are closed on disconnect.
+    
+    Returns:
+        dict with the new batch depth
+    """
+    return {"success": True, "depth": _begin_deferral(_current_state())}
+
+
+@handler("end_batch")
+def end_batch() -> dict:
+    """
+    Close a begin_batch bracket.
+    
+    Returns:
+        dict with the remaining batch depth and number of documents recomputed
+    """
+    state = _current_state()
+    if not state.depth:
+        return {"success": False, "message": "No batch in progress"}
+    
+    recomputed = _end_deferral(state)
+    return {"success": True, "depth": state.depth, "recomputed": recomputed}
+
+
 class CommandDispatcher:
     """
     Dispatches JSON-RPC commands to registered handlers.
@@ -34,6 +171,9 @@ class CommandDispatcher:
     
     def __init__(self):
         self.handlers: Dict[str, Callable] = {}
+        # (handler count, sorted method names); the table only grows, and
+        # _register_all_handlers fills it directly, so the count is the key
+        self._method_names = (0, [])
         
     def register(self, method: str, handler_func: Callable) -> None:
         """Register a handler for a method."""
@@ -53,17 +193,20 @@ class CommandDispatcher:
         Raises:
             MethodNotFoundError: If no handler is registered for the method
         """
-        from common.exceptions import MethodNotFoundError
-        
-        handler_func = self.handlers.get(method)
-        if handler_func is None:
-            raise MethodNotFoundError(method)
+        try:
+            handler_func = self.handlers[method]
+        except KeyError:
+            raise MethodNotFoundError(method) from None
             
         return handler_func(**params)
         
     def list_methods(self) -> List[str]:
         """Return list of registered method names."""
-        return sorted(self.handlers.keys())
+        count, names = self._method_names
+        if count != len(self.handlers):
+            names = sorted(self.handlers)
+            self._method_names = (len(names), names)
+        return list(names)
 
 
 # Global dispatcher instance
@@ -87,16 +230,14 @@ def _register_all_handlers(dispatcher: CommandDispatcher) -> None:
     from . import boolean
     from . import export
     
-    # Register decorated handlers
-    for method, handler_func in _handlers.items():
-        dispatcher.register(method, handler_func)
-        
-    # Register built-in handlers
-    dispatcher.register('ping', _ping)
-    dispatcher.register('get_version', _get_version)
-    dispatcher.register('list_methods', lambda: dispatcher.list_methods())
+    # Register decorated handlers in one bulk copy, then the built-ins
+    handlers = dispatcher.handlers
+    handlers.update(_handlers)
+    handlers['ping'] = _ping
+    handlers['get_version'] = _get_version
+    handlers['list_methods'] = dispatcher.list_methods
     
-    print(f"Registered {len(dispatcher.handlers)} command handlers")
+    print(f"Registered {len(handlers)} command handlers")
 
 
 # Built-in handlers
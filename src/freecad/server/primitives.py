@@ -4,28 +4,46 @@ FreeCAD Part Primitives Handlers
 Handlers for creating Part primitives (Box, Sphere, Cylinder, etc.).
 """
 
+import sys
+import base64
+from array import array
 from typing import Optional, List, Dict, Any
-from .handlers import handler
+
+import FreeCAD
+import Part
+
+from common.exceptions import ObjectNotFoundError
+
+from .handlers import handler, schedule_recompute
+from .cache import find_object, forget_object, shaped_objects, touch_document
+
+# Bound once for set_placement
+_Vector = FreeCAD.Vector
+_Rotation = FreeCAD.Rotation
+
+# Euler rotation axes; Rotation() copies its axis, so these are never modified
+_AXIS_X = _Vector(1, 0, 0)
+_AXIS_Y = _Vector(0, 1, 0)
+_AXIS_Z = _Vector(0, 0, 1)
 
 
 def _ensure_document():
     """Ensure a document exists."""
-    import FreeCAD
-    if FreeCAD.ActiveDocument is None:
-        FreeCAD.newDocument("Unnamed")
-    return FreeCAD.ActiveDocument
+    doc = FreeCAD.ActiveDocument
+    if doc is None:
+        doc = FreeCAD.newDocument("Unnamed")
+    return doc
 
 
 def _add_object_to_doc(shape, name: str, doc=None):
     """Add a shape to the document as a Part::Feature."""
-    import FreeCAD
-    
     if doc is None:
         doc = _ensure_document()
         
     obj = doc.addObject("Part::Feature", name)
     obj.Shape = shape
-    doc.recompute()
+    touch_document(doc)
+    schedule_recompute(doc)
     
     return obj
 
@@ -51,15 +69,13 @@ def create_box(
     Returns:
         dict with object info
     """
-    import FreeCAD
-    import Part
-    
     doc = _ensure_document()
     
     box = Part.makeBox(length, width, height)
     
-    if position:
-        box.translate(FreeCAD.Vector(*position))
+    # Shapes are built at the origin; skip the no-op translate for [0, 0, 0]
+    if position and any(position):
+        box.translate(_Vector(*position))
         
     obj = _add_object_to_doc(box, name, doc)
     
@@ -88,15 +104,12 @@ def create_sphere(
     Returns:
         dict with object info
     """
-    import FreeCAD
-    import Part
-    
     doc = _ensure_document()
     
     sphere = Part.makeSphere(radius)
     
-    if position:
-        sphere.translate(FreeCAD.Vector(*position))
+    if position and any(position):
+        sphere.translate(_Vector(*position))
         
     obj = _add_object_to_doc(sphere, name, doc)
     
@@ -127,15 +140,12 @@ def create_cylinder(
     Returns:
         dict with object info
     """
-    import FreeCAD
-    import Part
-    
     doc = _ensure_document()
     
     cylinder = Part.makeCylinder(radius, height)
     
-    if position:
-        cylinder.translate(FreeCAD.Vector(*position))
+    if position and any(position):
+        cylinder.translate(_Vector(*position))
         
     obj = _add_object_to_doc(cylinder, name, doc)
     
@@ -169,15 +179,12 @@ def create_cone(
     Returns:
         dict with object info
     """
-    import FreeCAD
-    import Part
-    
     doc = _ensure_document()
     
     cone = Part.makeCone(radius1, radius2, height)
     
-    if position:
-        cone.translate(FreeCAD.Vector(*position))
+    if position and any(position):
+        cone.translate(_Vector(*position))
         
     obj = _add_object_to_doc(cone, name, doc)
     
@@ -210,15 +217,12 @@ def create_torus(
     Returns:
         dict with object info
     """
-    import FreeCAD
-    import Part
-    
     doc = _ensure_document()
     
     torus = Part.makeTorus(radius1, radius2)
     
-    if position:
-        torus.translate(FreeCAD.Vector(*position))
+    if position and any(position):
+        torus.translate(_Vector(*position))
         
     obj = _add_object_to_doc(torus, name, doc)
     
@@ -250,15 +254,12 @@ def create_plane(
     Returns:
         dict with object info
     """
-    import FreeCAD
-    import Part
-    
     doc = _ensure_document()
     
     plane = Part.makePlane(length, width)
     
-    if position:
-        plane.translate(FreeCAD.Vector(*position))
+    if position and any(position):
+        plane.translate(_Vector(*position))
         
     obj = _add_object_to_doc(plane, name, doc)
     
@@ -295,8 +296,6 @@ def create_wedge(
     Returns:
         dict with object info
     """
-    import Part
-    
     doc = _ensure_document()
     
     wedge = Part.makeWedge(xmin, ymin, zmin, x2min, z2min, xmax, ymax, zmax, x2max, z2max)
@@ -328,8 +327,6 @@ def create_helix(
     Returns:
         dict with object info
     """
-    import Part
-    
     doc = _ensure_document()
     
     helix = Part.makeHelix(pitch, height, radius)
@@ -356,14 +353,11 @@ def get_object(name: str) -> dict:
     Returns:
         dict with object info
     """
-    import FreeCAD
-    from common.exceptions import ObjectNotFoundError
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         raise ObjectNotFoundError(name)
         
-    obj = doc.getObject(name)
+    obj = find_object(doc, name)
     if obj is None:
         raise ObjectNotFoundError(name)
         
@@ -373,15 +367,31 @@ def get_object(name: str) -> dict:
         "type": obj.TypeId,
     }
     
-    if hasattr(obj, 'Shape'):
-        result["bounding_box"] = _get_bounding_box(obj.Shape)
-        result["volume"] = obj.Shape.Volume if hasattr(obj.Shape, 'Volume') else None
-        result["area"] = obj.Shape.Area if hasattr(obj.Shape, 'Area') else None
-        
-    if hasattr(obj, 'Placement'):
+    # EAFP: most objects are Part features that have all of these, so
+    # try/except is cheaper than probing with hasattr first
+    try:
+        shape = obj.Shape
+    except AttributeError:
+        pass
+    else:
+        result["bounding_box"] = _get_bounding_box(shape)
+        try:
+            result["volume"] = shape.Volume
+        except AttributeError:
+            result["volume"] = None
+        try:
+            result["area"] = shape.Area
+        except AttributeError:
+            result["area"] = None
+        
+    try:
+        placement = obj.Placement
+    except AttributeError:
+        pass
+    else:
         result["placement"] = {
-            "position": list(obj.Placement.Base),
-            "rotation": list(obj.Placement.Rotation.Q)
+            "position": list(placement.Base),
+            "rotation": list(placement.Rotation.Q)
         }
         
     return result
@@ -395,8 +405,6 @@ def list_objects() -> dict:
     Returns:
         dict with list of objects
     """
-    import FreeCAD
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         return {"objects": [], "count": 0}
@@ -416,6 +424,56 @@ def list_objects() -> dict:
     }
 
 
+# Per-object record layout for list_objects_bboxes (float64 each)
+_BBOX_LAYOUT = (
+    "min_x", "min_y", "min_z",
+    "max_x", "max_y", "max_z",
+    "size_x", "size_y", "size_z",
+)
+
+
+@handler("list_objects_bboxes")
+def list_objects_bboxes() -> dict:
+    """
+    Get the bounding boxes of every shape object in one response.
+    
+    Saves a get_object round-trip per object. Each object is one record of
+    len(_BBOX_LAYOUT) little-endian float64 values, base64-encoded; names
+    are returned in the same order.
+    
+    Returns:
+        dict with names, layout and the packed bounding boxes
+    """
+    doc = FreeCAD.ActiveDocument
+    objs = shaped_objects(doc) if doc is not None else []
+    
+    names = []
+    data = array('d')
+    for obj in objs:
+        bb = obj.Shape.BoundBox
+        xmin, ymin, zmin = bb.XMin, bb.YMin, bb.ZMin
+        xmax, ymax, zmax = bb.XMax, bb.YMax, bb.ZMax
+        names.append(obj.Name)
+        data.extend((
+            xmin, ymin, zmin,
+            xmax, ymax, zmax,
+            xmax - xmin, ymax - ymin, zmax - zmin,
+        ))
+        
+    if sys.byteorder != "little":
+        data.byteswap()
+        
+    return {
+        "count": len(names),
+        "names": names,
+        "dtype": "float64",
+        "byte_order": "little",
+        "stride": len(_BBOX_LAYOUT),
+        "layout": list(_BBOX_LAYOUT),
+        "bboxes_b64": base64.b64encode(data.tobytes()).decode("ascii")
+    }
+
+
 @handler("delete_object")
 def delete_object(name: str) -> dict:
     """
@@ -427,19 +485,17 @@ def delete_object(name: str) -> dict:
     Returns:
         dict with success status
     """
-    import FreeCAD
-    from common.exceptions import ObjectNotFoundError
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         raise ObjectNotFoundError(name)
         
-    obj = doc.getObject(name)
+    obj = find_object(doc, name)
     if obj is None:
         raise ObjectNotFoundError(name)
         
+    forget_object(doc, name)
     doc.removeObject(name)
-    doc.recompute()
+    schedule_recompute(doc)
     
     return {
         "success": True,
@@ -459,14 +515,11 @@ def rename_object(old_name: str, new_name: str) -> dict:
     Returns:
         dict with success status
     """
-    import FreeCAD
-    from common.exceptions import ObjectNotFoundError
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         raise ObjectNotFoundError(old_name)
         
-    obj = doc.getObject(old_name)
+    obj = find_object(doc, old_name)
     if obj is None:
         raise ObjectNotFoundError(old_name)
         
@@ -491,14 +544,11 @@ def copy_object(name: str, new_name: str) -> dict:
     Returns:
         dict with new object info
     """
-    import FreeCAD
-    from common.exceptions import ObjectNotFoundError
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         raise ObjectNotFoundError(name)
         
-    obj = doc.getObject(name)
+    obj = find_object(doc, name)
     if obj is None:
         raise ObjectNotFoundError(name)
         
@@ -531,52 +581,51 @@ def set_placement(
     Returns:
         dict with success status
     """
-    import FreeCAD
-    from common.exceptions import ObjectNotFoundError
-    
     doc = FreeCAD.ActiveDocument
     if doc is None:
         raise ObjectNotFoundError(name)
         
-    obj = doc.getObject(name)
+    obj = find_object(doc, name)
     if obj is None:
         raise ObjectNotFoundError(name)
         
     placement = obj.Placement
     
     if position:
-        placement.Base = FreeCAD.Vector(*position)
+        placement.Base = _Vector(*position)
         
     if rotation:
         if len(rotation) == 4:
             # Quaternion
-            placement.Rotation = FreeCAD.Rotation(*rotation)
+            placement.Rotation = _Rotation(*rotation)
         elif len(rotation) == 3:
             # Euler angles (degrees)
-            placement.Rotation = FreeCAD.Rotation(
-                FreeCAD.Vector(1, 0, 0), rotation[0]
-            ).multiply(FreeCAD.Rotation(
-                FreeCAD.Vector(0, 1, 0), rotation[1]
-            )).multiply(FreeCAD.Rotation(
-                FreeCAD.Vector(0, 0, 1), rotation[2]
-            ))
+            placement.Rotation = _Rotation(_AXIS_X, rotation[0]).multiply(
+                _Rotation(_AXIS_Y, rotation[1])
+            ).multiply(_Rotation(_AXIS_Z, rotation[2]))
             
     obj.Placement = placement
-    doc.recompute()
+    schedule_recompute(doc)
     
+    # Read the stored placement back once rather than per field
+    placement = obj.Placement
     return {
         "success": True,
         "object": name,
-        "position": list(obj.Placement.Base),
-        "rotation": list(obj.Placement.Rotation.Q)
+        "position": list(placement.Base),
+        "rotation": list(placement.Rotation.Q)
     }
 
 
 def _get_bounding_box(shape) -> dict:
     """Get bounding box of a shape."""
+    # Tuples serialize like lists but skip list over-allocation; the size is
+    # derived from the extents instead of three more property fetches
     bb = shape.BoundBox
+    xmin, ymin, zmin = bb.XMin, bb.YMin, bb.ZMin
+    xmax, ymax, zmax = bb.XMax, bb.YMax, bb.ZMax
     return {
-        "min": [bb.XMin, bb.YMin, bb.ZMin],
-        "max": [bb.XMax, bb.YMax, bb.ZMax],
-        "size": [bb.XLength, bb.YLength, bb.ZLength]
+        "min": (xmin, ymin, zmin),
+        "max": (xmax, ymax, zmax),
+        "size": (xmax - xmin, ymax - ymin, zmax - zmin)
     }
@@ -2,21 +2,82 @@
 FreeCAD Socket Server
 
 TCP socket server for receiving JSON-RPC commands and executing FreeCAD operations.
+A single selector-driven IO thread serves every client, and a single worker
+thread runs the handlers, since FreeCAD documents aren't thread-safe.
 """
 
+import os
 import socket
+import selectors
 import threading
+import collections
 import json
 import signal
 import sys
-from typing import Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Callable
 
 # Add parent paths for imports
 sys.path.insert(0, str(__file__).rsplit('/src/', 1)[0] + '/src')
 
-from common.protocol import Request, Response, ErrorResponse
+from common.protocol import (
+    Request, Response, ErrorResponse, MAX_FRAME_SIZE, dumps, encode_success, loads
+)
 from common.exceptions import TDMAPIError
 
+from .handlers import (
+    DeferralState, close_deferral, deferral_scope, deferred_recompute, get_dispatcher
+)
+
+# Bytes read from a client socket per recv() call
+BUFFER_SIZE = 65536
+# Kernel socket buffers, sized for large payloads such as STEP exports
+SOCKET_BUFFER_SIZE = 256 * 1024
+# How often the IO loop wakes up to check for shutdown
+SELECT_TIMEOUT = 1.0
+# Default cap on open client connections; extra connections are turned away
+MAX_CLIENTS = 32
+
+# Selector data marking the worker's wakeup socket
+_WAKEUP = object()
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Configure a socket for low-latency request/response traffic."""
+    # Don't let small responses sit in Nagle's buffer
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+
+
+class _ClientConnection:
+    """Per-connection state owned by the server's IO thread."""
+    
+    __slots__ = (
+        "sock", "address", "buffer", "scan_from", "outbox", "closed", "deferral",
+        "pending", "eof", "trailer",
+    )
+    
+    def __init__(self, sock: socket.socket, address: tuple):
+        self.sock = sock
+        self.address = address
+        # Raw bytes; complete messages are parsed without decoding to str
+        self.buffer = bytearray()
+        # Bytes already searched for a newline
+        self.scan_from = 0
+        # Response bytes the socket couldn't take yet
+        self.outbox = bytearray()
+        self.closed = False
+        # begin_batch/end_batch state; only touched on the worker thread
+        self.deferral = DeferralState()
+        # Messages handed to the worker whose responses aren't delivered yet
+        self.pending = 0
+        # The client is done sending (EOF, or we stopped reading); the
+        # connection closes once pending responses have been written out
+        self.eof = False
+        # Bytes to send after the last pending response, before closing
+        self.trailer: Optional[bytes] = None
+
 
 class FreeCADSocketServer:
     """
@@ -25,21 +86,42 @@ class FreeCADSocketServer:
     Accepts JSON-RPC commands over TCP and dispatches them to registered handlers.
     """
     
-    def __init__(self, host: str = '127.0.0.1', port: int = 9877):
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 9877,
+        max_accepts: Optional[int] = None,
+        max_clients: int = MAX_CLIENTS
+    ):
         """
         Initialize the socket server.
         
         Args:
             host: Host address to bind to
             port: Port number to listen on
+            max_accepts: Most connections accepted per listener wakeup
+                         (defaults to the CPU count)
+            max_clients: Most client connections open at once
         """
         self.host = host
         self.port = port
+        self.max_accepts = max(1, max_accepts or os.cpu_count() or 1)
+        self.max_clients = max(1, max_clients)
         self.socket: Optional[socket.socket] = None
         self.running = False
         self.clients = []
+        self._clients_lock = threading.Lock()
         self.dispatcher = None
         self._shutdown_event = threading.Event()
+        self._selector: Optional[selectors.BaseSelector] = None
+        # Handlers run one at a time on this thread, overlapping with the
+        # IO thread's socket reads and writes for other clients
+        self._worker: Optional[ThreadPoolExecutor] = None
+        # (connection, response bytes) finished by the worker, and the
+        # socket pair it uses to wake the IO loop
+        self._completed = collections.deque()
+        self._wakeup_recv: Optional[socket.socket] = None
+        self._wakeup_send: Optional[socket.socket] = None
         
     def set_dispatcher(self, dispatcher) -> None:
         """Set the command dispatcher for handling requests."""
@@ -49,31 +131,28 @@ class FreeCADSocketServer:
         """Start the socket server (blocking)."""
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.socket.settimeout(1.0)  # Allow periodic shutdown checks
+        # Set before listen() so accepted sockets start with the larger window
+        _tune_socket(self.socket)
         
         try:
             self.socket.bind((self.host, self.port))
-            self.socket.listen(5)
+            self.socket.listen(max(5, self.max_accepts))
+            self.socket.setblocking(False)
+            
+            self._wakeup_recv, self._wakeup_send = socket.socketpair()
+            self._wakeup_recv.setblocking(False)
+            self._wakeup_send.setblocking(False)
+            
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self.socket, selectors.EVENT_READ, None)
+            self._selector.register(self._wakeup_recv, selectors.EVENT_READ, _WAKEUP)
+            self._worker = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tdm-freecad"
+            )
             self.running = True
             print(f"FreeCAD Socket Server listening on {self.host}:{self.port}")
             
-            while self.running and not self._shutdown_event.is_set():
-                try:
-                    client_socket, address = self.socket.accept()
-                    print(f"Client connected from {address}")
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client_socket, address),
-                        daemon=True
-                    )
-                    client_thread.start()
-                    self.clients.append((client_socket, client_thread))
-                except socket.timeout:
-                    continue
-                except OSError:
-                    if self.running:
-                        raise
-                    break
+            self._serve_loop()
                     
         except Exception as e:
             print(f"Server error: {e}")
@@ -85,14 +164,22 @@ class FreeCADSocketServer:
         """Stop the socket server and close all connections."""
         self.running = False
         self._shutdown_event.set()
+        # Wake the IO loop so it notices right away
+        self._wake()
+        
+        if self._worker is not None:
+            self._worker.shutdown(wait=False)
+            self._worker = None
         
         # Close all client connections
-        for client_socket, _ in self.clients:
-            try:
-                client_socket.close()
-            except:
-                pass
-        self.clients.clear()
+        with self._clients_lock:
+            for conn in self.clients:
+                conn.closed = True
+                try:
+                    conn.sock.close()
+                except:
+                    pass
+            self.clients.clear()
         
         # Close server socket
         if self.socket:
@@ -104,109 +191,393 @@ class FreeCADSocketServer:
             
         print("FreeCAD Socket Server stopped")
         
-    def _handle_client(self, client_socket: socket.socket, address: tuple) -> None:
-        """
-        Handle a client connection.
-        
-        Args:
-            client_socket: The client socket
-            address: Client address tuple
-        """
-        buffer = ""
-        client_socket.settimeout(30.0)
-        
+    def _serve_loop(self) -> None:
+        """IO loop that accepts connections and serves every client."""
+        selector = self._selector
         try:
-            while self.running:
-                try:
-                    data = client_socket.recv(4096)
-                    if not data:
-                        break
-                        
-                    buffer += data.decode('utf-8')
-                    
-                    # Process complete messages (newline-delimited)
-                    while '\n' in buffer:
-                        message, buffer = buffer.split('\n', 1)
-                        if message.strip():
-                            response = self._process_message(message)
-                            client_socket.sendall((response + '\n').encode('utf-8'))
-                            
-                except socket.timeout:
-                    continue
-                except ConnectionResetError:
-                    break
-                    
+            while self.running and not self._shutdown_event.is_set():
+                for key, mask in selector.select(timeout=SELECT_TIMEOUT):
+                    conn = key.data
+                    if conn is None:
+                        self._accept()
+                    elif conn is _WAKEUP:
+                        self._deliver_completed()
+                    else:
+                        if mask & selectors.EVENT_READ:
+                            self._on_readable(conn)
+                        if mask & selectors.EVENT_WRITE and not conn.closed:
+                            self._flush(conn)
         except Exception as e:
-            print(f"Client handler error: {e}")
+            if self.running:
+                print(f"Server loop error: {e}")
+                raise
         finally:
+            with self._clients_lock:
+                clients = list(self.clients)
+            for conn in clients:
+                self._close(conn)
+            selector.close()
+            self._selector = None
+            for sock in (self._wakeup_recv, self._wakeup_send):
+                if sock is not None:
+                    sock.close()
+            self._wakeup_recv = self._wakeup_send = None
+            
+    def _accept(self) -> None:
+        """Accept up to max_accepts pending connections."""
+        for _ in range(self.max_accepts):
             try:
-                client_socket.close()
-            except:
+                client_socket, address = self.socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                if self.running:
+                    print(f"Accept error: {e}")
+                return
+            
+            if len(self.clients) >= self.max_clients:
+                self._reject(client_socket, address)
+                continue
+            
+            print(f"Client connected from {address}")
+            client_socket.setblocking(False)
+            _tune_socket(client_socket)
+            conn = _ClientConnection(client_socket, address)
+            
+            with self._clients_lock:
+                self.clients.append(conn)
+            self._selector.register(client_socket, selectors.EVENT_READ, conn)
+            
+    def _reject(self, client_socket: socket.socket, address: tuple) -> None:
+        """Turn away a connection over the max_clients limit."""
+        print(f"Rejecting client {address}: {self.max_clients} clients connected")
+        try:
+            client_socket.setblocking(False)
+            client_socket.send(ErrorResponse(
+                code="SERVER_BUSY",
+                message=f"Server is at its limit of {self.max_clients} clients"
+            ).to_bytes())
+        except OSError:
+            pass
+        finally:
+            client_socket.close()
+            
+    def _on_readable(self, conn: _ClientConnection) -> None:
+        """Read from a client and queue every complete message for the worker."""
+        try:
+            data = conn.sock.recv(BUFFER_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._stop_reading(conn)
+            return
+        if not data:
+            # A half-closed client still gets answers to what it sent
+            self._stop_reading(conn)
+            return
+        
+        buffer = conn.buffer
+        buffer += data
+        
+        # Process complete messages (newline-delimited)
+        start = 0
+        idx = buffer.find(b'\n', conn.scan_from)
+        while idx >= 0:
+            message = bytes(buffer[start:idx])
+            start = idx + 1
+            # isspace() tests for blank lines without copying like strip()
+            if message and not message.isspace():
+                # The single worker runs messages in arrival order, so each
+                # client gets its responses in request order
+                conn.pending += 1
+                self._worker.submit(self._respond, conn, message)
+            idx = buffer.find(b'\n', start)
+        
+        # Drop all consumed messages with a single shift
+        if start:
+            del buffer[:start]
+        conn.scan_from = len(buffer)
+        
+        # Don't let a client that never sends a newline grow the buffer forever
+        if len(buffer) > MAX_FRAME_SIZE:
+            buffer.clear()
+            # Sent after the responses to the client's earlier messages
+            conn.trailer = ErrorResponse(
+                code="RECEIVE_ERROR",
+                message=f"Message exceeds limit of {MAX_FRAME_SIZE} bytes"
+            ).to_bytes()
+            self._stop_reading(conn)
+            
+    def _stop_reading(self, conn: _ClientConnection) -> None:
+        """Stop reading from a client; close once its pending responses are out."""
+        conn.eof = True
+        self._update_events(conn)
+        self._close_if_done(conn)
+        
+    def _close_if_done(self, conn: _ClientConnection) -> None:
+        """Close a client that stopped sending once nothing is left to write."""
+        if conn.closed or not conn.eof or conn.pending:
+            return
+        if conn.trailer is not None:
+            data, conn.trailer = conn.trailer, None
+            self._send(conn, data)
+        if not conn.outbox:
+            self._close(conn)
+            
+    def _update_events(self, conn: _ClientConnection) -> None:
+        """Register a client for reads until EOF and for writes while output is queued."""
+        if conn.closed or self._selector is None:
+            return
+        events = 0 if conn.eof else selectors.EVENT_READ
+        if conn.outbox:
+            events |= selectors.EVENT_WRITE
+        try:
+            key = self._selector.get_key(conn.sock)
+        except KeyError:
+            key = None
+        
+        if not events:
+            if key is not None:
+                self._selector.unregister(conn.sock)
+        elif key is None:
+            self._selector.register(conn.sock, events, conn)
+        elif key.events != events:
+            self._selector.modify(conn.sock, events, conn)
+        
+    def _respond(self, conn: _ClientConnection, message: bytes) -> None:
+        """Worker thread: process a message and hand the response to the IO loop."""
+        try:
+            with deferral_scope(conn.deferral):
+                response = self._process_message(message)
+        except Exception as e:
+            response = ErrorResponse(
+                id=None,
+                code="RECEIVE_ERROR",
+                message=str(e)
+            ).to_bytes()
+        # Responses already end with the newline delimiter
+        self._completed.append((conn, response))
+        self._wake()
+        
+    def _wake(self) -> None:
+        """Interrupt the IO loop's select() from another thread."""
+        sock = self._wakeup_send
+        if sock is None:
+            return
+        try:
+            sock.send(b'\0')
+        except OSError:
+            # Buffer full means a wakeup is already pending
+            pass
+        
+    def _deliver_completed(self) -> None:
+        """Send every response the worker has finished."""
+        try:
+            while self._wakeup_recv.recv(4096):
                 pass
-            print(f"Client disconnected: {address}")
+        except (BlockingIOError, InterruptedError):
+            pass
+        
+        completed = self._completed
+        while completed:
+            conn, data = completed.popleft()
+            conn.pending -= 1
+            self._send(conn, data)
+            self._close_if_done(conn)
+            
+    def _send(self, conn: _ClientConnection, data: bytes) -> None:
+        """Send data to a client, queueing whatever the socket won't take."""
+        if conn.closed:
+            return
+        if conn.outbox:
+            conn.outbox += data
+            return
+        
+        try:
+            sent = conn.sock.send(data)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        except OSError:
+            self._close(conn)
+            return
+        
+        if sent < len(data):
+            # Only watch for writability while there is a backlog
+            conn.outbox += memoryview(data)[sent:]
+            self._update_events(conn)
+            
+    def _flush(self, conn: _ClientConnection) -> None:
+        """Write as much queued output to a client as the socket accepts."""
+        if conn.closed or not conn.outbox:
+            return
+        try:
+            sent = conn.sock.send(conn.outbox)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._close(conn)
+            return
+        
+        del conn.outbox[:sent]
+        if not conn.outbox:
+            self._update_events(conn)
+            self._close_if_done(conn)
             
-    def _process_message(self, message: str) -> str:
+    def _close(self, conn: _ClientConnection) -> None:
+        """Unregister and close a client connection."""
+        with self._clients_lock:
+            if conn in self.clients:
+                self.clients.remove(conn)
+        if self._selector is not None:
+            try:
+                self._selector.unregister(conn.sock)
+            except Exception:
+                pass
+        if conn.closed:
+            return
+        conn.closed = True
+        try:
+            conn.sock.close()
+        except:
+            pass
+        print(f"Client disconnected: {conn.address}")
+        
+        # Recompute whatever a batch left open by the client was holding back.
+        # Queued after the client's pending messages, so it runs last.
+        worker = self._worker
+        if worker is not None:
+            try:
+                worker.submit(self._close_deferral, conn)
+            except RuntimeError:
+                # Worker already shut down
+                pass
+                
+    @staticmethod
+    def _close_deferral(conn: _ClientConnection) -> None:
+        """Worker thread: end any begin_batch brackets a closed client left open."""
+        try:
+            close_deferral(conn.deferral)
+        except Exception as e:
+            print(f"Closing batch for {conn.address} failed: {e}")
+        
+    def _process_message(self, message: bytes) -> bytes:
         """
         Process a JSON-RPC message and return the response.
         
+        Works on raw bytes end to end: the request is parsed without decoding
+        to str first and the response is serialized straight to bytes.
+        A JSON array is treated as a batch of requests (see _process_batch).
+        
         Args:
-            message: JSON-RPC request string
+            message: UTF-8 encoded JSON-RPC request
             
         Returns:
-            JSON-RPC response string
+            UTF-8 encoded JSON-RPC response, newline-terminated
         """
         try:
-            request = Request.from_json(message)
+            data = loads(message)
+            if isinstance(data, list):
+                return self._process_batch(data)
+            request = Request.from_dict(data)
         except Exception as e:
             error_response = ErrorResponse(
                 id=None,
                 code="PARSE_ERROR",
                 message=f"Invalid JSON: {str(e)}"
             )
-            return error_response.to_json()
+            return error_response.to_bytes()
             
-        if self.dispatcher is None:
-            error_response = ErrorResponse(
-                id=request.id,
-                code="SERVER_ERROR",
-                message="No dispatcher configured"
-            )
-            return error_response.to_json()
+        try:
+            result = self._dispatch(request)
+        except Exception as e:
+            return self._error_response(request.id, e).to_bytes()
+        # Single requests skip building a Response object
+        return encode_success(result, request.id) + b'\n'
+        
+    def _process_batch(self, calls: list) -> bytes:
+        """
+        Execute a batch of requests and return a JSON array of responses.
+        
+        Calls run in order with document recomputes deferred until the end of
+        the batch. Execution stops at the first failing call, whose error is
+        the last entry in the returned array.
+        
+        Args:
+            calls: Parsed request objects
+            
+        Returns:
+            JSON array bytes with one response per executed call
+        """
+        responses = []
+        with deferred_recompute():
+            for call in calls:
+                if isinstance(call, dict):
+                    response = self._execute(Request.from_dict(call))
+                else:
+                    response = ErrorResponse(
+                        id=None,
+                        code="VALIDATION_ERROR",
+                        message="Batch entries must be request objects"
+                    )
+                responses.append(response.to_dict())
+                if isinstance(response, ErrorResponse):
+                    break
+        return dumps(responses) + b'\n'
+        
+    def _execute(self, request: Request):
+        """
+        Dispatch a single request.
+        
+        Args:
+            request: The parsed request
             
+        Returns:
+            Response on success, ErrorResponse on failure
+        """
         try:
-            result = self.dispatcher.dispatch(request.method, request.params)
-            response = Response(id=request.id, result=result)
-            return response.to_json()
-        except TDMAPIError as e:
-            error_response = ErrorResponse(
-                id=request.id,
-                code=e.code,
-                message=str(e),
-                details=e.details
-            )
-            return error_response.to_json()
+            return Response(id=request.id, result=self._dispatch(request))
         except Exception as e:
-            error_response = ErrorResponse(
-                id=request.id,
-                code="EXECUTION_ERROR",
-                message=str(e)
+            return self._error_response(request.id, e)
+            
+    def _dispatch(self, request: Request) -> Any:
+        """Run a request's handler and return its result (raises on failure)."""
+        if self.dispatcher is None:
+            raise TDMAPIError("No dispatcher configured", code="SERVER_ERROR")
+        return self.dispatcher.dispatch(request.method, request.params)
+        
+    @staticmethod
+    def _error_response(request_id: Optional[str], error: Exception) -> ErrorResponse:
+        """Build the error response for an exception raised by a handler."""
+        if isinstance(error, TDMAPIError):
+            return ErrorResponse(
+                id=request_id,
+                code=error.code,
+                message=str(error),
+                details=error.details
             )
-            return error_response.to_json()
+        return ErrorResponse(
+            id=request_id,
+            code="EXECUTION_ERROR",
+            message=str(error)
+        )
 
 
-def create_server(host: str = '127.0.0.1', port: int = 9877) -> FreeCADSocketServer:
+def create_server(
+    host: str = '127.0.0.1',
+    port: int = 9877,
+    max_accepts: Optional[int] = None
+) -> FreeCADSocketServer:
     """
     Create and configure a FreeCAD socket server.
     
     Args:
         host: Host address to bind to
         port: Port number to listen on
+        max_accepts: Most connections accepted per wakeup (CPU count if None)
         
     Returns:
         Configured FreeCADSocketServer instance
     """
-    from .handlers import get_dispatcher
-    
-    server = FreeCADSocketServer(host=host, port=port)
+    server = FreeCADSocketServer(host=host, port=port, max_accepts=max_accepts)
     server.set_dispatcher(get_dispatcher())
     return server
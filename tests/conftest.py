@@ -2,11 +2,74 @@
 Root Test Configuration
 
 Pytest configuration and fixtures.
+
+The suite can run in parallel with pytest-xdist:
+
+    pytest -n auto --dist loadgroup
+
+Object names are suffixed with the worker id (see unique_name) so workers
+don't collide on the shared Blender/FreeCAD servers, and tests that touch
+whole-scene state are grouped onto a single worker.
 """
 
 import pytest
+import httpx
 import sys
 import os
+import importlib.util
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+API_BASE = "http://localhost:8000"
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# pytest-xdist worker id ("gw0" when running serially)
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+
+# Test directories whose tests read or export the whole scene/document
+SCENE_TEST_DIRS = ("integration",)
+
+
+def pytest_configure(config):
+    # Registered here too so the marker is known without xdist installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of the same group on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep tests that depend on global scene state on the same worker."""
+    for item in items:
+        if any(part in SCENE_TEST_DIRS for part in item.path.parts):
+            item.add_marker(pytest.mark.xdist_group("scene"))
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    HTTP client for API requests.
+    
+    One client for the whole session, so the Blender and FreeCAD suites
+    share a single connection pool.
+    """
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+    with httpx.Client(
+        base_url=API_BASE,
+        http2=HTTP2,
+        timeout=30.0,
+        proxy=None,
+        trust_env=False,  # local API; ignore proxy settings in the environment
+        limits=limits,
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def unique_name():
+    """Make object names unique per xdist worker, e.g. "TestCube" -> "TestCube_gw0"."""
+    def make(name: str) -> str:
+        return f"{name}_{WORKER_ID}"
+    return make
@@ -6,33 +6,36 @@ Pytest fixtures for integration tests.
 
 import pytest
 import httpx
-import os
+import time
 
 API_BASE = "http://localhost:8000"
 
-# Disable proxy for local tests
-os.environ.pop('HTTP_PROXY', None)
-os.environ.pop('HTTPS_PROXY', None)
-os.environ.pop('http_proxy', None)
-os.environ.pop('https_proxy', None)
-os.environ.pop('ALL_PROXY', None)
-os.environ.pop('all_proxy', None)
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_client():
-    """HTTP client for API requests."""
-    with httpx.Client(base_url=API_BASE, timeout=60.0, proxy=None) as client:
+    """HTTP client for API requests, shared so tests reuse pooled connections."""
+    limits = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+    with httpx.Client(
+        base_url=API_BASE,
+        timeout=60.0,
+        proxy=None,
+        trust_env=False,  # local API; ignore proxy settings in the environment
+        limits=limits,
+    ) as client:
         yield client
 
 
-@pytest.fixture
-def services_available(api_client):
-    """Check if all services are available."""
+# Health probe attempts and the delay before the first retry (doubled each time)
+PROBE_ATTEMPTS = 3
+PROBE_BACKOFF = 0.5
+
+
+def _probe_services(client) -> bool:
+    """Check the API and both CAD services once."""
     try:
-        health = api_client.get("/health").json()
-        blender = api_client.get("/health/blender").json()
-        freecad = api_client.get("/health/freecad").json()
+        health = client.get("/health").json()
+        blender = client.get("/health/blender").json()
+        freecad = client.get("/health/freecad").json()
         return (
             health.get("status") == "healthy" and
             blender.get("status") == "connected" and
@@ -42,6 +45,24 @@ def services_available(api_client):
         return False
 
 
+@pytest.fixture(scope="session")
+def services_available(api_client):
+    """
+    Check if all services are available.
+    
+    Probed once per session, with a short retry so a service that is still
+    starting up isn't reported as missing.
+    """
+    delay = PROBE_BACKOFF
+    for attempt in range(PROBE_ATTEMPTS):
+        if _probe_services(api_client):
+            return True
+        if attempt < PROBE_ATTEMPTS - 1:
+            time.sleep(delay)
+            delay *= 2
+    return False
+
+
 @pytest.fixture(autouse=True)
 def skip_if_services_unavailable(request, services_available):
     """Skip integration tests if services are not available."""
@@ -11,17 +11,17 @@ import os
 class TestBlenderWorkflow:
     """Test complete Blender workflow."""
     
-    def test_create_scene_and_render(self, api_client):
+    def test_create_scene_and_render(self, api_client, unique_name):
         """Test creating a scene with objects and rendering."""
         # Create objects
         response = api_client.post("/api/v1/blender/primitives/cube", json={
-            "size": 2.0, "name": "WorkflowCube", "location": [0, 0, 0]
+            "size": 2.0, "name": unique_name("WorkflowCube"), "location": [0, 0, 0]
         })
         assert response.status_code == 200
         assert response.json().get("status") == "success"
         
         response = api_client.post("/api/v1/blender/primitives/sphere", json={
-            "radius": 1.0, "name": "WorkflowSphere", "location": [3, 0, 0]
+            "radius": 1.0, "name": unique_name("WorkflowSphere"), "location": [3, 0, 0]
         })
         assert response.status_code == 200
         assert response.json().get("status") == "success"
@@ -30,16 +30,18 @@ class TestBlenderWorkflow:
         response = api_client.get("/api/v1/blender/scene")
         assert response.status_code == 200
         
-    def test_api_to_blender_response(self, api_client):
+    def test_api_to_blender_response(self, api_client, unique_name):
         """Test full API to Blender round trip."""
+        name = unique_name("RoundTripCube")
+        
         # Create object
         response = api_client.post("/api/v1/blender/primitives/cube", json={
-            "name": "RoundTripCube"
+            "name": name
         })
         assert response.status_code == 200
         
         # Get object
-        response = api_client.get("/api/v1/blender/objects/RoundTripCube")
+        response = api_client.get(f"/api/v1/blender/objects/{name}")
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
@@ -52,23 +54,25 @@ class TestBlenderWorkflow:
 class TestFreeCADWorkflow:
     """Test complete FreeCAD workflow."""
     
-    def test_create_parts_boolean_export(self, api_client):
+    def test_create_parts_boolean_export(self, api_client, unique_name):
         """Test creating parts, boolean ops, and export."""
         # Create box
         response = api_client.post("/api/v1/freecad/primitives/box", json={
-            "length": 20, "width": 20, "height": 20, "name": "WFBox"
+            "length": 20, "width": 20, "height": 20, "name": unique_name("WFBox")
         })
         assert response.json()["status"] == "success"
         
         # Create sphere
         response = api_client.post("/api/v1/freecad/primitives/sphere", json={
-            "radius": 12, "name": "WFSphere"
+            "radius": 12, "name": unique_name("WFSphere")
         })
         assert response.json()["status"] == "success"
         
         # Boolean subtract
         response = api_client.post("/api/v1/freecad/boolean/subtract", json={
-            "base": "WFBox", "tool": "WFSphere", "name": "WFResult"
+            "base": unique_name("WFBox"),
+            "tool": unique_name("WFSphere"),
+            "name": unique_name("WFResult"),
         })
         assert response.json()["status"] == "success"
         
@@ -78,16 +82,18 @@ class TestFreeCADWorkflow:
         })
         assert response.json()["status"] == "success"
         
-    def test_api_to_freecad_response(self, api_client):
+    def test_api_to_freecad_response(self, api_client, unique_name):
         """Test full API to FreeCAD round trip."""
+        name = unique_name("FCRoundTrip")
+        
         # Create object
         response = api_client.post("/api/v1/freecad/primitives/box", json={
-            "name": "FCRoundTrip", "length": 10, "width": 10, "height": 10
+            "name": name, "length": 10, "width": 10, "height": 10
         })
         assert response.status_code == 200
         
         # Get object
-        response = api_client.get("/api/v1/freecad/objects/FCRoundTrip")
+        response = api_client.get(f"/api/v1/freecad/objects/{name}")
         assert response.status_code == 200
         
         # List objects
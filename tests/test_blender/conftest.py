@@ -5,35 +5,27 @@ Pytest fixtures for Blender tests.
 """
 
 import pytest
-import httpx
-import os
+from types import SimpleNamespace
 
-API_BASE = "http://localhost:8000"
 
-# Disable proxy for local tests
-os.environ.pop('HTTP_PROXY', None)
-os.environ.pop('HTTPS_PROXY', None)
-os.environ.pop('http_proxy', None)
-os.environ.pop('https_proxy', None)
-os.environ.pop('ALL_PROXY', None)
-os.environ.pop('all_proxy', None)
-
-
-@pytest.fixture
-def api_client():
-    """HTTP client for API requests."""
-    with httpx.Client(base_url=API_BASE, timeout=30.0, proxy=None) as client:
-        yield client
+@pytest.fixture(scope="session")
+def blender_health(api_client):
+    """
+    Blender health report, probed once per session.
+    
+    Fields of the /health/blender response are attributes; status is
+    "unreachable" if the API couldn't be queried.
+    """
+    try:
+        return SimpleNamespace(**api_client.get("/health/blender").json())
+    except:
+        return SimpleNamespace(status="unreachable")
 
 
-@pytest.fixture
-def blender_available(api_client):
+@pytest.fixture(scope="session")
+def blender_available(blender_health):
     """Check if Blender server is available."""
-    try:
-        response = api_client.get("/health/blender")
-        return response.json().get("status") == "connected"
-    except:
-        return False
+    return getattr(blender_health, "status", None) == "connected"
 
 
 @pytest.fixture(autouse=True)
@@ -12,7 +12,35 @@ Usage:
 import socket
 import json
 import argparse
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(data) -> bytes:
+        """Serialize data to compact JSON bytes."""
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    _loads = json.loads
+
+
+# Kernel send/receive buffer size for pipelined load tests
+SOCKET_BUFFER_SIZE = 64 * 1024
+
+# TCP keepalive: first probe after 30s idle, then every 10s, give up after 3
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
+
+# Request templates for the create calls load tests issue in bulk; None
+# location/name mean the server's defaults
+_CUBE_TEMPLATE = {"method": "create_cube", "params": {"size": 2.0, "location": None, "name": None}}
+_SPHERE_TEMPLATE = {"method": "create_sphere", "params": {"radius": 1.0, "location": None, "name": None}}
 
 
 class BlenderTestClient:
@@ -22,21 +50,49 @@ class BlenderTestClient:
         self.host = host
         self.port = port
         self.socket = None
+        self._rfile = None
+        self._wfile = None
     
     def connect(self):
         """Connect to the server."""
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Requests are small and followed by a blocking read; don't let Nagle hold them
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):  # Linux
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
         self.socket.connect((self.host, self.port))
         self.socket.settimeout(30.0)
+        self._rfile = self.socket.makefile('rb')
+        self._wfile = self.socket.makefile('wb')
         print(f"Connected to {self.host}:{self.port}")
     
     def disconnect(self):
         """Disconnect from the server."""
         if self.socket:
-            self.socket.close()
-            self.socket = None
+            self._close_socket()
             print("Disconnected")
     
+    def _close_socket(self):
+        """Close the socket and its file objects, ignoring errors from a dead peer."""
+        for f in (self._wfile, self._rfile):
+            try:
+                f.close()
+            except OSError:
+                pass
+        self._rfile = self._wfile = None
+        self.socket.close()
+        self.socket = None
+    
+    def _reconnect(self):
+        """Replace a connection the server dropped (e.g. an idle timeout)."""
+        self._close_socket()
+        self.connect()
+    
     def send_command(self, method: str, params: dict = None, request_id: str = None) -> dict:
         """
         Send a command to the server and return the response.
@@ -58,21 +114,74 @@ class BlenderTestClient:
         }
         if request_id:
             request["id"] = request_id
+        return self._send_request(request)
+    
+    def _send_template(self, template: dict, **params) -> dict:
+        """Send a copy of a request template with some params filled in."""
+        if self.socket is None:
+            raise RuntimeError("Not connected")
         
-        # Send request
-        message = json.dumps(request) + "\n"
-        self.socket.send(message.encode('utf-8'))
+        request = template.copy()
+        request["params"] = {**template["params"], **params}
+        return self._send_request(request)
+    
+    def _send_request(self, request: dict) -> dict:
+        """
+        Send a request and return its response, reconnecting once if needed.
         
-        # Receive response
-        buffer = ""
-        while '\n' not in buffer:
-            data = self.socket.recv(4096)
-            if not data:
+        Only a connection the server had already dropped (e.g. an idle
+        timeout) is retried: the write fails, or the read hits EOF before any
+        response byte, so the request never ran. A reset while reading isn't
+        retried, since the server may have executed the request.
+        """
+        payload = _dumps(request) + b'\n'
+        line = self._exchange(payload)
+        if line is None:
+            self._reconnect()
+            line = self._exchange(payload)
+            if line is None:
                 raise RuntimeError("Connection closed")
-            buffer += data.decode('utf-8')
+        return _loads(line)
+    
+    def _exchange(self, payload: bytes) -> Optional[bytes]:
+        """Write a request and read one response line; None if the connection was stale."""
+        try:
+            self._wfile.write(payload)
+            self._wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return None
         
-        response_str = buffer.split('\n')[0]
-        return json.loads(response_str)
+        # Receive response (buffered reader handles partial reads)
+        return self._rfile.readline() or None
+    
+    def send_pipelined(self, commands: List[Tuple[str, Optional[dict]]]) -> List[dict]:
+        """
+        Send several independent commands at once and return their responses.
+        
+        All requests are written before any response is read, so the batch
+        costs one round-trip instead of one per command. The server answers
+        a connection's requests in order.
+        
+        Args:
+            commands: (method, params) pairs
+            
+        Returns:
+            The response dictionaries, in command order
+        """
+        if self.socket is None:
+            raise RuntimeError("Not connected")
+        
+        for method, params in commands:
+            self._wfile.write(_dumps({"method": method, "params": params or {}}) + b'\n')
+        self._wfile.flush()
+        
+        responses = []
+        for _ in commands:
+            line = self._rfile.readline()
+            if not line:
+                raise RuntimeError("Connection closed")
+            responses.append(_loads(line))
+        return responses
     
     def ping(self) -> dict:
         """Send a ping command."""
@@ -88,21 +197,11 @@ class BlenderTestClient:
     
     def create_cube(self, location=None, size=2.0, name=None) -> dict:
         """Create a cube."""
-        params = {"size": size}
-        if location:
-            params["location"] = location
-        if name:
-            params["name"] = name
-        return self.send_command("create_cube", params)
+        return self._send_template(_CUBE_TEMPLATE, size=size, location=location, name=name)
     
     def create_sphere(self, location=None, radius=1.0, name=None) -> dict:
         """Create a sphere."""
-        params = {"radius": radius}
-        if location:
-            params["location"] = location
-        if name:
-            params["name"] = name
-        return self.send_command("create_sphere", params)
+        return self._send_template(_SPHERE_TEMPLATE, radius=radius, location=location, name=name)
     
     def list_objects(self) -> dict:
         """List all objects."""
@@ -143,82 +242,82 @@ class BlenderTestClient:
         return self.send_command("get_scene_info")
 
 
-def run_tests(client: BlenderTestClient):
-    """Run a series of tests."""
+def run_tests(client: BlenderTestClient, verbose: bool = False):
+    """
+    Run a series of tests.
+    
+    Args:
+        client: Connected test client
+        verbose: Also print each response, not just the outcome
+    """
     print("\n" + "=" * 50)
     print("Running Tests")
     print("=" * 50)
     
+    def passed(title: str, *details: str):
+        """Report a passed test with a single write."""
+        lines = [f"\n{title}..."]
+        if verbose:
+            lines.extend(details)
+        lines.append("  ✓ Passed")
+        print("\n".join(lines))
+    
+    # Tests 1-3 are read-only, so send them in one pipelined round-trip
+    ping, version, methods = client.send_pipelined([
+        ("ping", None),
+        ("get_version", None),
+        ("list_methods", None),
+    ])
+    
     # Test 1: Ping
-    print("\n[Test 1] Ping...")
-    result = client.ping()
-    print(f"  Result: {result}")
-    assert result.get("status") == "success", "Ping failed"
-    print("  ✓ Passed")
+    assert ping.get("status") == "success", "Ping failed"
+    passed("[Test 1] Ping", f"  Result: {ping}")
     
     # Test 2: Get Version
-    print("\n[Test 2] Get Version...")
-    result = client.get_version()
-    print(f"  Result: {result}")
-    assert result.get("status") == "success", "Get version failed"
-    print("  ✓ Passed")
+    assert version.get("status") == "success", "Get version failed"
+    passed("[Test 2] Get Version", f"  Result: {version}")
     
     # Test 3: List Methods
-    print("\n[Test 3] List Methods...")
-    result = client.list_methods()
-    print(f"  Methods: {result.get('result', {}).get('methods', [])[:5]}...")
-    assert result.get("status") == "success", "List methods failed"
-    print("  ✓ Passed")
+    assert methods.get("status") == "success", "List methods failed"
+    passed("[Test 3] List Methods",
+           f"  Methods: {methods.get('result', {}).get('methods', [])[:5]}...")
     
     # Test 4: Clear Scene
-    print("\n[Test 4] Clear Scene...")
     result = client.clear_scene()
-    print(f"  Result: {result}")
     assert result.get("status") == "success", "Clear scene failed"
-    print("  ✓ Passed")
+    passed("[Test 4] Clear Scene", f"  Result: {result}")
     
     # Test 5: Create Cube
-    print("\n[Test 5] Create Cube...")
     result = client.create_cube(location=[0, 0, 0], size=2, name="TestCube")
-    print(f"  Result: {result}")
     assert result.get("status") == "success", "Create cube failed"
-    print("  ✓ Passed")
+    passed("[Test 5] Create Cube", f"  Result: {result}")
     
     # Test 6: Create Sphere
-    print("\n[Test 6] Create Sphere...")
     result = client.create_sphere(location=[3, 0, 0], radius=1, name="TestSphere")
-    print(f"  Result: {result}")
     assert result.get("status") == "success", "Create sphere failed"
-    print("  ✓ Passed")
+    passed("[Test 6] Create Sphere", f"  Result: {result}")
     
     # Test 7: List Objects
-    print("\n[Test 7] List Objects...")
     result = client.list_objects()
-    print(f"  Objects: {result.get('result', {}).get('objects', [])}")
     assert result.get("status") == "success", "List objects failed"
-    print("  ✓ Passed")
+    passed("[Test 7] List Objects", f"  Objects: {result.get('result', {}).get('objects', [])}")
     
     # Test 8: Create Material
-    print("\n[Test 8] Create Material...")
     result = client.create_material("RedMaterial", color=[1, 0, 0, 1])
-    print(f"  Result: {result}")
     assert result.get("status") == "success", "Create material failed"
-    print("  ✓ Passed")
+    passed("[Test 8] Create Material", f"  Result: {result}")
     
     # Test 9: Apply Material
-    print("\n[Test 9] Apply Material...")
     result = client.apply_material("TestCube", "RedMaterial")
-    print(f"  Result: {result}")
     assert result.get("status") == "success", "Apply material failed"
-    print("  ✓ Passed")
+    passed("[Test 9] Apply Material", f"  Result: {result}")
     
     # Test 10: Get Scene Info
-    print("\n[Test 10] Get Scene Info...")
     result = client.get_scene_info()
-    print(f"  Scene: {result.get('result', {}).get('scene_name')}")
-    print(f"  Object count: {result.get('result', {}).get('object_count')}")
     assert result.get("status") == "success", "Get scene info failed"
-    print("  ✓ Passed")
+    passed("[Test 10] Get Scene Info",
+           f"  Scene: {result.get('result', {}).get('scene_name')}",
+           f"  Object count: {result.get('result', {}).get('object_count')}")
     
     print("\n" + "=" * 50)
     print("All tests passed!")
@@ -230,6 +329,7 @@ def main():
     parser.add_argument('--host', type=str, default='localhost', help='Server host')
     parser.add_argument('--port', type=int, default=9876, help='Server port')
     parser.add_argument('--interactive', '-i', action='store_true', help='Interactive mode')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Print full responses')
     args = parser.parse_args()
     
     client = BlenderTestClient(host=args.host, port=args.port)
@@ -267,7 +367,7 @@ def main():
                 except KeyboardInterrupt:
                     break
         else:
-            run_tests(client)
+            run_tests(client, verbose=args.verbose)
             
     except ConnectionRefusedError:
         print(f"Error: Could not connect to server at {args.host}:{args.port}")
@@ -5,35 +5,53 @@ Pytest fixtures for FreeCAD tests.
 """
 
 import pytest
-import httpx
-import os
-
-API_BASE = "http://localhost:8000"
-
-# Disable proxy for local tests
-os.environ.pop('HTTP_PROXY', None)
-os.environ.pop('HTTPS_PROXY', None)
-os.environ.pop('http_proxy', None)
-os.environ.pop('https_proxy', None)
-os.environ.pop('ALL_PROXY', None)
-os.environ.pop('all_proxy', None)
-
-
-@pytest.fixture
-def api_client():
-    """HTTP client for API requests."""
-    with httpx.Client(base_url=API_BASE, timeout=30.0, proxy=None) as client:
-        yield client
+from types import SimpleNamespace
+
+
+@pytest.fixture(scope="module")
+def boolean_fixtures(api_client, unique_name, freecad_available):
+    """
+    Box and sphere shared by a module's boolean tests.
+    
+    Boolean operations keep their inputs by default, so the same pair can
+    be reused; it is created once per module and removed afterwards.
+    
+    Returns:
+        (box name, sphere name)
+    """
+    if not freecad_available:
+        pytest.skip("FreeCAD server not available")
+    
+    box, sphere = unique_name("BoolBox"), unique_name("BoolSphere")
+    api_client.post("/api/v1/freecad/primitives/box", json={
+        "length": 10, "width": 10, "height": 10, "name": box
+    })
+    api_client.post("/api/v1/freecad/primitives/sphere", json={
+        "radius": 8, "name": sphere
+    })
+    yield box, sphere
+    api_client.delete(f"/api/v1/freecad/objects/{box}")
+    api_client.delete(f"/api/v1/freecad/objects/{sphere}")
+
+
+@pytest.fixture(scope="session")
+def freecad_health(api_client):
+    """
+    FreeCAD health report, probed once per session.
+    
+    Fields of the /health/freecad response are attributes; status is
+    "unreachable" if the API couldn't be queried.
+    """
+    try:
+        return SimpleNamespace(**api_client.get("/health/freecad").json())
+    except:
+        return SimpleNamespace(status="unreachable")
 
 
-@pytest.fixture
-def freecad_available(api_client):
+@pytest.fixture(scope="session")
+def freecad_available(freecad_health):
     """Check if FreeCAD server is available."""
-    try:
-        response = api_client.get("/health/freecad")
-        return response.json().get("status") == "connected"
-    except:
-        return False
+    return getattr(freecad_health, "status", None) == "connected"
 
 
 @pytest.fixture(autouse=True)
@@ -10,62 +10,56 @@ import pytest
 class TestFreeCADBoolean:
     """Test FreeCAD boolean operations."""
     
-    def test_boolean_union(self, api_client):
+    def test_boolean_union(self, api_client, boolean_fixtures, unique_name):
         """Test boolean union."""
-        # Create two objects
-        api_client.post("/api/v1/freecad/primitives/box", json={
-            "length": 10, "width": 10, "height": 10, "name": "UnionBox1"
-        })
-        api_client.post("/api/v1/freecad/primitives/sphere", json={
-            "radius": 8, "name": "UnionSphere1"
-        })
+        box, sphere = boolean_fixtures
+        result = unique_name("UnionResult")
         
-        # Perform union
-        response = api_client.post("/api/v1/freecad/boolean/union", json={
-            "object1": "UnionBox1",
-            "object2": "UnionSphere1",
-            "name": "UnionResult"
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
+        try:
+            response = api_client.post("/api/v1/freecad/boolean/union", json={
+                "object1": box,
+                "object2": sphere,
+                "name": result
+            })
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "success"
+        finally:
+            # Also clean up after a failed assertion
+            api_client.delete(f"/api/v1/freecad/objects/{result}")
         
-    def test_boolean_subtract(self, api_client):
+    def test_boolean_subtract(self, api_client, boolean_fixtures, unique_name):
         """Test boolean subtraction."""
-        # Create objects
-        api_client.post("/api/v1/freecad/primitives/box", json={
-            "length": 15, "width": 15, "height": 15, "name": "SubBase"
-        })
-        api_client.post("/api/v1/freecad/primitives/sphere", json={
-            "radius": 10, "name": "SubTool"
-        })
+        box, sphere = boolean_fixtures
+        result = unique_name("SubResult")
         
-        # Perform subtract
-        response = api_client.post("/api/v1/freecad/boolean/subtract", json={
-            "base": "SubBase",
-            "tool": "SubTool",
-            "name": "SubResult"
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
+        try:
+            response = api_client.post("/api/v1/freecad/boolean/subtract", json={
+                "base": box,
+                "tool": sphere,
+                "name": result
+            })
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "success"
+        finally:
+            # Also clean up after a failed assertion
+            api_client.delete(f"/api/v1/freecad/objects/{result}")
         
-    def test_boolean_intersect(self, api_client):
+    def test_boolean_intersect(self, api_client, boolean_fixtures, unique_name):
         """Test boolean intersection."""
-        # Create objects
-        api_client.post("/api/v1/freecad/primitives/box", json={
-            "length": 10, "width": 10, "height": 10, "name": "IntBox"
-        })
-        api_client.post("/api/v1/freecad/primitives/sphere", json={
-            "radius": 8, "name": "IntSphere"
-        })
+        box, sphere = boolean_fixtures
+        result = unique_name("IntResult")
         
-        # Perform intersect
-        response = api_client.post("/api/v1/freecad/boolean/intersect", json={
-            "object1": "IntBox",
-            "object2": "IntSphere",
-            "name": "IntResult"
-        })
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "success"
+        try:
+            response = api_client.post("/api/v1/freecad/boolean/intersect", json={
+                "object1": box,
+                "object2": sphere,
+                "name": result
+            })
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "success"
+        finally:
+            # Also clean up after a failed assertion
+            api_client.delete(f"/api/v1/freecad/objects/{result}")
@@ -10,46 +10,46 @@ import pytest
 class TestFreeCADPrimitives:
     """Test FreeCAD primitive creation."""
     
-    def test_create_box(self, api_client):
+    def test_create_box(self, api_client, unique_name):
         """Test creating a box."""
         response = api_client.post("/api/v1/freecad/primitives/box", json={
             "length": 10.0,
             "width": 10.0,
             "height": 10.0,
-            "name": "TestBox"
+            "name": unique_name("TestBox")
         })
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
         
-    def test_create_sphere(self, api_client):
+    def test_create_sphere(self, api_client, unique_name):
         """Test creating a sphere."""
         response = api_client.post("/api/v1/freecad/primitives/sphere", json={
             "radius": 5.0,
-            "name": "TestSphere"
+            "name": unique_name("TestSphere")
         })
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
         
-    def test_create_cylinder(self, api_client):
+    def test_create_cylinder(self, api_client, unique_name):
         """Test creating a cylinder."""
         response = api_client.post("/api/v1/freecad/primitives/cylinder", json={
             "radius": 3.0,
             "depth": 10.0,
-            "name": "TestCylinder"
+            "name": unique_name("TestCylinder")
         })
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
         
-    def test_create_with_dimensions(self, api_client):
+    def test_create_with_dimensions(self, api_client, unique_name):
         """Test creating box with specific dimensions."""
         response = api_client.post("/api/v1/freecad/primitives/box", json={
             "length": 20.0,
             "width": 15.0,
             "height": 5.0,
-            "name": "DimensionBox"
+            "name": unique_name("DimensionBox")
         })
         assert response.status_code == 200
         data = response.json()
@@ -0,0 +1,80 @@
+"""
+FreeCAD Socket Server Tests
+
+Tests for the socket server's connection handling. These run the server
+in-process with a stub dispatcher, so FreeCAD isn't needed.
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from freecad.server.handlers import CommandDispatcher
+from freecad.server.server import FreeCADSocketServer
+
+
+@pytest.fixture
+def socket_server():
+    """Socket server on an ephemeral port with echo and slow_echo methods."""
+    dispatcher = CommandDispatcher()
+    dispatcher.register("echo", lambda value=None: {"value": value})
+    
+    def slow_echo(value=None, delay: float = 0.2):
+        time.sleep(delay)
+        return {"value": value}
+    dispatcher.register("slow_echo", slow_echo)
+    
+    server = FreeCADSocketServer(host="127.0.0.1", port=0)
+    server.set_dispatcher(dispatcher)
+    thread = threading.Thread(target=server.start, daemon=True)
+    thread.start()
+    
+    deadline = time.monotonic() + 5.0
+    while not (server.running and server.socket is not None):
+        assert time.monotonic() < deadline, "server did not start"
+        time.sleep(0.01)
+    
+    yield server.socket.getsockname()
+    server.stop()
+    thread.join(timeout=5.0)
+
+
+def _read_responses(sock: socket.socket) -> list:
+    """Read newline-delimited responses until the server closes the connection."""
+    data = b""
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+
+class TestSocketServerHalfClose:
+    """Test that clients which half-close still get their responses."""
+    
+    def test_response_after_half_close(self, socket_server):
+        """Responses to requests sent before SHUT_WR are delivered, then the server closes."""
+        with socket.create_connection(socket_server, timeout=5.0) as sock:
+            sock.sendall(
+                b'{"id": "1", "method": "slow_echo", "params": {"value": "a"}}\n'
+                b'{"id": "2", "method": "echo", "params": {"value": "b"}}\n'
+            )
+            sock.shutdown(socket.SHUT_WR)
+            responses = _read_responses(sock)
+        
+        assert [r["id"] for r in responses] == ["1", "2"]
+        assert [r["result"]["value"] for r in responses] == ["a", "b"]
+    
+    def test_half_close_without_requests(self, socket_server):
+        """A client that sends nothing and half-closes is closed right away."""
+        with socket.create_connection(socket_server, timeout=5.0) as sock:
+            sock.shutdown(socket.SHUT_WR)
+            assert _read_responses(sock) == []
@@ -9,7 +9,30 @@ import socket
 import json
 import argparse
 import sys
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(data) -> bytes:
+        """Serialize data to compact JSON bytes."""
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    _loads = json.loads
+
+
+# Kernel send/receive buffer size for pipelined load tests
+SOCKET_BUFFER_SIZE = 64 * 1024
+
+# TCP keepalive: first probe after 30s idle, then every 10s, give up after 3
+KEEPALIVE_IDLE = 30
+KEEPALIVE_INTERVAL = 10
+KEEPALIVE_COUNT = 3
 
 
 class FreeCADTestClient:
@@ -19,14 +42,27 @@ class FreeCADTestClient:
         self.host = host
         self.port = port
         self.socket: Optional[socket.socket] = None
+        self._rfile = None
+        self._wfile = None
         self.request_id = 0
         
     def connect(self) -> bool:
         """Connect to the server."""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Requests are small and followed by a blocking read; don't let Nagle hold them
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):  # Linux
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, KEEPALIVE_IDLE)
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, KEEPALIVE_INTERVAL)
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, KEEPALIVE_COUNT)
             self.socket.settimeout(30.0)
             self.socket.connect((self.host, self.port))
+            self._rfile = self.socket.makefile('rb')
+            self._wfile = self.socket.makefile('wb')
             print(f"Connected to {self.host}:{self.port}")
             return True
         except Exception as e:
@@ -36,10 +72,26 @@ class FreeCADTestClient:
     def disconnect(self):
         """Disconnect from the server."""
         if self.socket:
-            self.socket.close()
-            self.socket = None
+            self._close_socket()
             print("Disconnected")
             
+    def _close_socket(self):
+        """Close the socket and its file objects, ignoring errors from a dead peer."""
+        for f in (self._wfile, self._rfile):
+            try:
+                f.close()
+            except OSError:
+                pass
+        self._rfile = self._wfile = None
+        self.socket.close()
+        self.socket = None
+            
+    def _reconnect(self):
+        """Replace a connection the server dropped (e.g. an idle timeout)."""
+        self._close_socket()
+        if not self.connect():
+            raise RuntimeError("Reconnect failed")
+            
     def send_command(self, method: str, params: dict = None) -> dict:
         """Send a JSON-RPC command and return the response."""
         if not self.socket:
@@ -53,19 +105,66 @@ class FreeCADTestClient:
             "params": params or {}
         }
         
-        message = json.dumps(request) + "\n"
-        self.socket.sendall(message.encode('utf-8'))
+        return self._send_request(request)
+        
+    def _send_request(self, request: dict) -> dict:
+        """
+        Send a request and return its response, reconnecting once if needed.
         
-        # Receive response
-        buffer = ""
-        while '\n' not in buffer:
-            data = self.socket.recv(4096)
-            if not data:
+        Only a connection the server had already dropped (e.g. an idle
+        timeout) is retried: the write fails, or the read hits EOF before any
+        response byte, so the request never ran. A reset while reading isn't
+        retried, since the server may have executed the request.
+        """
+        payload = _dumps(request) + b'\n'
+        line = self._exchange(payload)
+        if line is None:
+            self._reconnect()
+            line = self._exchange(payload)
+            if line is None:
                 raise RuntimeError("Connection closed")
-            buffer += data.decode('utf-8')
+        return _loads(line)
+        
+    def _exchange(self, payload: bytes) -> Optional[bytes]:
+        """Write a request and read one response line; None if the connection was stale."""
+        try:
+            self._wfile.write(payload)
+            self._wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return None
+        
+        # Receive response (buffered reader handles partial reads)
+        return self._rfile.readline() or None
+        
+    def send_pipelined(self, commands: List[Tuple[str, Optional[dict]]]) -> List[dict]:
+        """
+        Send several independent commands at once and return their responses.
+        
+        All requests are written before any response is read, so the batch
+        costs one round-trip instead of one per command. The server answers
+        a connection's requests in order.
+        """
+        if not self.socket:
+            raise RuntimeError("Not connected")
             
-        response_str = buffer.split('\n')[0]
-        return json.loads(response_str)
+        for method, params in commands:
+            self.request_id += 1
+            request = {
+                "jsonrpc": "2.0",
+                "id": self.request_id,
+                "method": method,
+                "params": params or {}
+            }
+            self._wfile.write(_dumps(request) + b'\n')
+        self._wfile.flush()
+        
+        responses = []
+        for _ in commands:
+            line = self._rfile.readline()
+            if not line:
+                raise RuntimeError("Connection closed")
+            responses.append(_loads(line))
+        return responses
         
     # Convenience methods
     def ping(self) -> dict:
@@ -119,8 +218,8 @@ class FreeCADTestClient:
         })
 
 
-def run_tests(client: FreeCADTestClient):
-    """Run integration tests."""
+def run_tests(client: FreeCADTestClient, verbose: bool = False):
+    """Run integration tests (verbose also prints each response)."""
     print("\n" + "=" * 50)
     print("Running Tests")
     print("=" * 50 + "\n")
@@ -130,37 +229,49 @@ def run_tests(client: FreeCADTestClient):
     
     def test(name: str, func, expected_status: str = "success"):
         nonlocal tests_passed, tests_failed
-        print(f"[Test] {name}...")
+        # Collect the report and write it once per test
+        log = [f"[Test] {name}..."]
         try:
             result = func()
             status = result.get("status", "success" if "result" in result else "error")
-            if status == expected_status or "result" in result:
-                print(f"  Result: {result}")
-                print("  ✓ Passed\n")
-                tests_passed += 1
-                return result
-            else:
-                print(f"  Result: {result}")
-                print("  ✗ Failed\n")
-                tests_failed += 1
-                return None
+            passed = status == expected_status or "result" in result
+            if verbose or not passed:
+                log.append(f"  Result: {result}")
         except Exception as e:
-            print(f"  Error: {e}")
-            print("  ✗ Failed\n")
+            passed = False
+            log.append(f"  Error: {e}")
+        
+        if passed:
+            log.append("  ✓ Passed\n")
+            tests_passed += 1
+        else:
+            log.append("  ✗ Failed\n")
             tests_failed += 1
-            return None
+            result = None
+        print("\n".join(log))
+        return result
+    
+    # Tests 1-3 are read-only, so send them in one pipelined round-trip
+    try:
+        ping, version, methods = client.send_pipelined([
+            ("ping", None),
+            ("get_version", None),
+            ("list_methods", None),
+        ])
+    except Exception as e:
+        # Report the failure under each of the three tests
+        ping = version = methods = {"status": "error", "error": str(e)}
     
     # Test 1: Ping
-    test("Ping", client.ping)
+    test("Ping", lambda: ping)
     
     # Test 2: Get Version
-    test("Get Version", client.get_version)
+    test("Get Version", lambda: version)
     
     # Test 3: List Methods
-    result = test("List Methods", client.list_methods)
-    if result and "result" in result:
-        methods = result["result"]
-        print(f"  Available methods: {methods[:5]}...\n")
+    result = test("List Methods", lambda: methods)
+    if verbose and result and "result" in result:
+        print(f"  Available methods: {result['result'][:5]}...\n")
     
     # Test 4: New Document
     test("New Document", lambda: client.new_document("TestDoc"))
@@ -176,7 +287,7 @@ def run_tests(client: FreeCADTestClient):
     
     # Test 8: List Objects
     result = test("List Objects", client.list_objects)
-    if result and "result" in result:
+    if verbose and result and "result" in result:
         objects = result["result"].get("objects", [])
         print(f"  Objects: {[o['name'] for o in objects]}\n")
     
@@ -205,6 +316,7 @@ def main():
     parser = argparse.ArgumentParser(description='FreeCAD Test Client')
     parser.add_argument('--host', default='localhost', help='Server host')
     parser.add_argument('--port', type=int, default=9877, help='Server port')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Print full responses')
     args = parser.parse_args()
     
     client = FreeCADTestClient(host=args.host, port=args.port)
@@ -213,7 +325,7 @@ def main():
         sys.exit(1)
         
     try:
-        success = run_tests(client)
+        success = run_tests(client, verbose=args.verbose)
         sys.exit(0 if success else 1)
     finally:
         client.disconnect()